@@ -15,14 +15,16 @@ Examples:
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from string import Template
 
 # ============================================
 # Template Files
 # ============================================
 
-PACKAGE_JSON = """{
-  "name": "{name}",
+PACKAGE_JSON = Template("""{
+  "name": "${name}",
   "version": "1.0.0",
   "type": "module",
   "scripts": {
@@ -47,7 +49,7 @@ PACKAGE_JSON = """{
     "vite-plugin-singlefile": "^2.0.0"
   }
 }
-"""
+""")
 
 TSCONFIG_JSON = """{
   "compilerOptions": {
@@ -80,30 +82,30 @@ export default defineConfig({
 });
 """
 
-SERVER_TS = '''/**
- * {title} - MCP App Server
+SERVER_TS = Template('''/**
+ * ${title} - MCP App Server
  */
 
-console.log("Starting {title} server...");
+console.log("Starting ${title} server...");
 
 import { McpServer } from "@modelcontextprotocol/sdk/server/mcp.js";
 import { StreamableHTTPServerTransport } from "@modelcontextprotocol/sdk/server/streamableHttp.js";
-import {{
+import {
   registerAppTool,
   registerAppResource,
   RESOURCE_MIME_TYPE,
-}} from "@modelcontextprotocol/ext-apps/server";
+} from "@modelcontextprotocol/ext-apps/server";
 import cors from "cors";
 import express from "express";
 import fs from "node:fs/promises";
 import path from "node:path";
 
-const server = new McpServer({{
-  name: "{title}",
+const server = new McpServer({
+  name: "${title}",
   version: "1.0.0",
-}});
+});
 
-const resourceUri = "ui://{tool_name}/app.html";
+const resourceUri = "ui://${tool_name}/app.html";
 
 // ============================================
 // Register Tool with UI
@@ -111,39 +113,39 @@ const resourceUri = "ui://{tool_name}/app.html";
 
 registerAppTool(
   server,
-  "{tool_name}",
-  {{
-    title: "{title}",
+  "${tool_name}",
+  {
+    title: "${title}",
     description: "TODO: Describe what this tool does and when to use it",
-    inputSchema: {{
+    inputSchema: {
       type: "object",
-      properties: {{
-        query: {{
+      properties: {
+        query: {
           type: "string",
           description: "The input query",
-        }},
-      }},
-    }},
-    _meta: {{
-      ui: {{ resourceUri }},
-    }},
-  }},
-  async (args) => {{
-    const query = (args as {{ query?: string }}).query || "default";
+        },
+      },
+    },
+    _meta: {
+      ui: { resourceUri },
+    },
+  },
+  async (args) => {
+    const query = (args as { query?: string }).query || "default";
     
-    return {{
+    return {
       content: [
-        {{
+        {
           type: "text",
-          text: JSON.stringify({{
+          text: JSON.stringify({
             query,
             timestamp: new Date().toISOString(),
-            message: `Received: ${{query}}`,
-          }}),
-        }},
+            message: `Received: $${query}`,
+          }),
+        },
       ],
-    }};
-  }}
+    };
+  }
 );
 
 // ============================================
@@ -154,16 +156,16 @@ registerAppResource(
   server,
   resourceUri,
   resourceUri,
-  {{ mimeType: RESOURCE_MIME_TYPE }},
-  async () => {{
+  { mimeType: RESOURCE_MIME_TYPE },
+  async () => {
     const html = await fs.readFile(
       path.join(import.meta.dirname, "dist", "mcp-app.html"),
       "utf-8"
     );
-    return {{
-      contents: [{{ uri: resourceUri, mimeType: RESOURCE_MIME_TYPE, text: html }}],
-    }};
-  }}
+    return {
+      contents: [{ uri: resourceUri, mimeType: RESOURCE_MIME_TYPE, text: html }],
+    };
+  }
 );
 
 // ============================================
@@ -174,80 +176,80 @@ const expressApp = express();
 expressApp.use(cors());
 expressApp.use(express.json());
 
-expressApp.post("/mcp", async (req, res) => {{
-  const transport = new StreamableHTTPServerTransport({{
+expressApp.post("/mcp", async (req, res) => {
+  const transport = new StreamableHTTPServerTransport({
     sessionIdGenerator: undefined,
     enableJsonResponse: true,
-  }});
+  });
   res.on("close", () => transport.close());
   await server.connect(transport);
   await transport.handleRequest(req, res, req.body);
-}});
+});
 
-expressApp.get("/health", (req, res) => {{
-  res.json({{ status: "ok" }});
-}});
+expressApp.get("/health", (req, res) => {
+  res.json({ status: "ok" });
+});
 
 const PORT = process.env.PORT || 3001;
-expressApp.listen(PORT, () => {{
-  console.log(`Server listening on http://localhost:${{PORT}}/mcp`);
-}});
-'''
+expressApp.listen(PORT, () => {
+  console.log(`Server listening on http://localhost:$${PORT}/mcp`);
+});
+''')
 
-MCP_APP_HTML = """<!DOCTYPE html>
+MCP_APP_HTML = Template("""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8" />
   <meta name="viewport" content="width=device-width, initial-scale=1.0" />
-  <title>{title}</title>
+  <title>${title}</title>
   <style>
-    * {{
+    * {
       box-sizing: border-box;
       margin: 0;
       padding: 0;
-    }}
+    }
     
-    body {{
+    body {
       font-family: system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
       padding: 1rem;
       background: #fafafa;
       color: #1a1a1a;
-    }}
+    }
     
-    .container {{
+    .container {
       max-width: 600px;
       margin: 0 auto;
-    }}
+    }
     
-    h1 {{
+    h1 {
       font-size: 1.25rem;
       font-weight: 600;
       margin-bottom: 1rem;
-    }}
+    }
     
-    .card {{
+    .card {
       background: white;
       border: 1px solid #e5e5e5;
       border-radius: 8px;
       padding: 1rem;
       margin-bottom: 1rem;
-    }}
+    }
     
-    .label {{
+    .label {
       font-size: 0.75rem;
       font-weight: 500;
       color: #666;
       text-transform: uppercase;
       letter-spacing: 0.05em;
       margin-bottom: 0.5rem;
-    }}
+    }
     
-    .value {{
+    .value {
       font-size: 1rem;
       color: #1a1a1a;
-    }}
+    }
     
-    button {{
+    button {
       background: #0066cc;
       color: white;
       border: none;
@@ -257,51 +259,51 @@ MCP_APP_HTML = """<!DOCTYPE html>
       font-weight: 500;
       cursor: pointer;
       transition: background 0.15s;
-    }}
+    }
     
-    button:hover {{
+    button:hover {
       background: #0052a3;
-    }}
+    }
     
-    button:disabled {{
+    button:disabled {
       background: #ccc;
       cursor: not-allowed;
-    }}
+    }
     
-    .status {{
+    .status {
       font-size: 0.875rem;
       color: #666;
       margin-top: 1rem;
-    }}
+    }
     
-    .error {{
+    .error {
       color: #cc0000;
-    }}
+    }
     
-    @media (prefers-color-scheme: dark) {{
-      body {{
+    @media (prefers-color-scheme: dark) {
+      body {
         background: #1a1a1a;
         color: #fafafa;
-      }}
+      }
       
-      .card {{
+      .card {
         background: #2a2a2a;
         border-color: #3a3a3a;
-      }}
+      }
       
-      .label {{
+      .label {
         color: #999;
-      }}
+      }
       
-      .value {{
+      .value {
         color: #fafafa;
-      }}
-    }}
+      }
+    }
   </style>
 </head>
 <body>
   <div class="container">
-    <h1>{title}</h1>
+    <h1>${title}</h1>
     
     <div class="card">
       <div class="label">Result</div>
@@ -316,104 +318,104 @@ MCP_APP_HTML = """<!DOCTYPE html>
   <script type="module" src="/src/mcp-app.ts"></script>
 </body>
 </html>
-"""
+""")
 
-MCP_APP_TS = '''/**
- * {title} - UI Logic
+MCP_APP_TS = Template('''/**
+ * ${title} - UI Logic
  */
 
-import {{ App }} from "@modelcontextprotocol/ext-apps";
+import { App } from "@modelcontextprotocol/ext-apps";
 
 const resultEl = document.getElementById("result")!;
 const refreshBtn = document.getElementById("refresh-btn")! as HTMLButtonElement;
 const statusEl = document.getElementById("status")!;
 
-const app = new App({{
-  name: "{title}",
+const app = new App({
+  name: "${title}",
   version: "1.0.0",
-}});
+});
 
 // Connect to host
 app.connect();
-app.log("info", "{title} initialized");
+app.log("info", "${title} initialized");
 
 // ============================================
 // Handle Tool Results
 // ============================================
 
-interface ToolData {{
+interface ToolData {
   query: string;
   timestamp: string;
   message: string;
-}}
+}
 
-app.ontoolresult = (result) => {{
-  try {{
+app.ontoolresult = (result) => {
+  try {
     const textContent = result.content?.find((c) => c.type === "text");
-    if (textContent && "text" in textContent) {{
+    if (textContent && "text" in textContent) {
       const data: ToolData = JSON.parse(textContent.text);
       renderResult(data);
-      statusEl.textContent = `Updated: ${{new Date().toLocaleTimeString()}}`;
+      statusEl.textContent = `Updated: $${new Date().toLocaleTimeString()}`;
       statusEl.classList.remove("error");
-    }}
-  }} catch (error) {{
+    }
+  } catch (error) {
     console.error("Failed to parse result:", error);
     resultEl.textContent = "Error parsing result";
     statusEl.classList.add("error");
-  }}
-}};
+  }
+};
 
 // ============================================
 // Render
 // ============================================
 
-function renderResult(data: ToolData) {{
+function renderResult(data: ToolData) {
   resultEl.innerHTML = `
-    <div><strong>Query:</strong> ${{escapeHtml(data.query)}}</div>
-    <div><strong>Message:</strong> ${{escapeHtml(data.message)}}</div>
-    <div><strong>Time:</strong> ${{new Date(data.timestamp).toLocaleString()}}</div>
+    <div><strong>Query:</strong> $${escapeHtml(data.query)}</div>
+    <div><strong>Message:</strong> $${escapeHtml(data.message)}</div>
+    <div><strong>Time:</strong> $${new Date(data.timestamp).toLocaleString()}</div>
   `;
-}}
+}
 
-function escapeHtml(text: string): string {{
+function escapeHtml(text: string): string {
   const div = document.createElement("div");
   div.textContent = text;
   return div.innerHTML;
-}}
+}
 
 // ============================================
 // User Interactions
 // ============================================
 
-refreshBtn.addEventListener("click", async () => {{
+refreshBtn.addEventListener("click", async () => {
   refreshBtn.disabled = true;
   statusEl.textContent = "Refreshing...";
   
-  try {{
-    const result = await app.callServerTool({{
-      name: "{tool_name}",
-      arguments: {{ query: "refresh-" + Date.now() }},
-    }});
+  try {
+    const result = await app.callServerTool({
+      name: "${tool_name}",
+      arguments: { query: "refresh-" + Date.now() },
+    });
     
     const textContent = result.content?.find((c) => c.type === "text");
-    if (textContent && "text" in textContent) {{
+    if (textContent && "text" in textContent) {
       const data: ToolData = JSON.parse(textContent.text);
       renderResult(data);
-      statusEl.textContent = `Refreshed: ${{new Date().toLocaleTimeString()}}`;
+      statusEl.textContent = `Refreshed: $${new Date().toLocaleTimeString()}`;
       
-      await app.updateModelContext({{
-        content: [{{ type: "text", text: `User refreshed: ${{data.message}}` }}],
-      }});
-    }}
-  }} catch (error) {{
+      await app.updateModelContext({
+        content: [{ type: "text", text: `User refreshed: $${data.message}` }],
+      });
+    }
+  } catch (error) {
     console.error("Refresh failed:", error);
     statusEl.textContent = "Refresh failed";
     statusEl.classList.add("error");
-  }} finally {{
+  } finally {
     refreshBtn.disabled = false;
-  }}
-}});
-'''
+  }
+});
+''')
 
 GITIGNORE = """node_modules/
 dist/
@@ -422,7 +424,7 @@ dist/
 .env.local
 """
 
-README = """# {title}
+README = Template("""# ${title}
 
 An MCP App that renders interactive UI inside Claude, ChatGPT, and VSCode.
 
@@ -450,12 +452,12 @@ npm run dev
 
 3. Add to Claude as custom connector using the cloudflared URL.
 
-4. Ask Claude to use {tool_name}.
+4. Ask Claude to use ${tool_name}.
 
 ## Project Structure
 
 ```
-{name}/
+${name}/
 ├── server.ts        # MCP server with tool + resource
 ├── mcp-app.html     # UI entry point
 ├── src/
@@ -470,17 +472,47 @@ npm run dev
 1. Edit `server.ts` to modify tool logic and input schema
 2. Edit `mcp-app.html` and `src/mcp-app.ts` for UI changes
 3. Run `npm run dev` to rebuild and test
-"""
+""")
+
+
+_TOOL_NAME_TABLE = str.maketrans({" ": "-", "_": "-"})
 
 
 def to_title_case(name: str) -> str:
     """Convert kebab-case to Title Case."""
-    return " ".join(word.capitalize() for word in name.split("-"))
+    # Not str.title(): that also capitalizes after digits and underscores
+    return " ".join(map(str.capitalize, name.split("-")))
 
 
 def to_tool_name(name: str) -> str:
     """Convert to valid tool name (lowercase with hyphens)."""
-    return name.lower().replace(" ", "-").replace("_", "-")
+    return name.lower().translate(_TOOL_NAME_TABLE)
+
+
+def write_file(path: Path, data: bytes) -> None:
+    """Write bytes with a bare open/write/close, skipping buffered-IO setup."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _render_files(project_name: str, title: str, tool_name: str) -> tuple[tuple[str, bytes], ...]:
+    """Render every project file, encoded and ready to write."""
+    files = {
+        "package.json": PACKAGE_JSON.substitute(name=project_name),
+        "tsconfig.json": TSCONFIG_JSON,
+        "vite.config.ts": VITE_CONFIG,
+        "server.ts": SERVER_TS.substitute(title=title, tool_name=tool_name),
+        "mcp-app.html": MCP_APP_HTML.substitute(title=title),
+        "src/mcp-app.ts": MCP_APP_TS.substitute(title=title, tool_name=tool_name),
+        ".gitignore": GITIGNORE,
+        "README.md": README.substitute(title=title, name=project_name, tool_name=tool_name),
+    }
+    return tuple((filename, content.encode("utf-8")) for filename, content in files.items())
 
 
 def create_project(project_name: str, output_dir: Path) -> None:
@@ -495,25 +527,11 @@ def create_project(project_name: str, output_dir: Path) -> None:
     project_dir.mkdir(parents=True)
     (project_dir / "src").mkdir()
     
-    # Template variables
-    title = to_title_case(project_name)
-    tool_name = to_tool_name(project_name)
-    
-    # Write files
-    files = {
-        "package.json": PACKAGE_JSON.format(name=project_name),
-        "tsconfig.json": TSCONFIG_JSON,
-        "vite.config.ts": VITE_CONFIG,
-        "server.ts": SERVER_TS.format(title=title, tool_name=tool_name),
-        "mcp-app.html": MCP_APP_HTML.format(title=title),
-        "src/mcp-app.ts": MCP_APP_TS.format(title=title, tool_name=tool_name),
-        ".gitignore": GITIGNORE,
-        "README.md": README.format(title=title, name=project_name, tool_name=tool_name),
-    }
+    files = _render_files(project_name, to_title_case(project_name), to_tool_name(project_name))
+    with ThreadPoolExecutor(max_workers=len(files)) as executor:
+        list(executor.map(lambda kv: write_file(project_dir / kv[0], kv[1]), files))
     
-    for filename, content in files.items():
-        filepath = project_dir / filename
-        filepath.write_text(content)
+    for filename, _ in files:
         print(f"  Created: {filename}")
     
     print(f"\n✓ MCP App project created: {project_dir}")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Run many op commands concurrently with asyncio subprocesses.
+
+Each command is a separate op process; a semaphore caps how many run at
+once, since op starts returning errors past roughly 10-20 parallel
+requests. Results come back in input order as (success, stdout, stderr)
+tuples, matching op_common.run_op_command.
+
+Usage (library):
+    from op_async import bulk_delete, run_many
+    results = run_many([["item", "get", "abc123", "--format", "json"], ...])
+    results = bulk_delete(["abc123", "def456"])
+"""
+
+import asyncio
+import re
+
+DEFAULT_CONCURRENCY = 8
+
+# Errors worth retrying: only rate limiting, where op rejected the request
+# outright. A timeout or dropped connection may have already applied the change
+RATE_LIMIT_ERRORS = re.compile(r"429|too many requests|rate limit", re.IGNORECASE)
+
+# Subcommands that are never retried: a rerun of one that went through fails
+NON_IDEMPOTENT = {"delete"}
+
+
+async def run_op(args: list[str]) -> tuple[bool, bytes, str]:
+    """Run one op command and return success, raw stdout bytes, stderr."""
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "op", *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except FileNotFoundError:
+        return False, b"", "1Password CLI not found. Install with: brew install --cask 1password-cli"
+    except Exception as e:
+        return False, b"", str(e)
+
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=60)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        return False, b"", "Command timed out"
+
+    return process.returncode == 0, stdout, stderr.decode("utf-8", "replace").strip()
+
+
+async def _run_limited(args: list[str], semaphore: asyncio.Semaphore, retries: int) -> tuple[bool, bytes, str]:
+    if args[1:2] and args[1] in NON_IDEMPOTENT:
+        retries = 0
+    for attempt in range(retries + 1):
+        async with semaphore:
+            success, stdout, error = await run_op(args)
+        if success or attempt == retries or not RATE_LIMIT_ERRORS.search(error):
+            return success, stdout, error
+        # Back off outside the semaphore so other commands keep running
+        await asyncio.sleep(2 ** attempt)
+
+
+async def gather_ops(
+    commands: list[list[str]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    retries: int = 0
+) -> list[tuple[bool, bytes, str]]:
+    """Run commands concurrently, at most `concurrency` at a time, retrying rate-limited ones."""
+    semaphore = asyncio.Semaphore(concurrency)
+    return await asyncio.gather(*(_run_limited(args, semaphore, retries) for args in commands))
+
+
+def run_many(
+    commands: list[list[str]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    retries: int = 0
+) -> list[tuple[bool, bytes, str]]:
+    """Synchronous wrapper around gather_ops for scripts without an event loop."""
+    if not commands:
+        return []
+    return asyncio.run(gather_ops(commands, concurrency, retries))
+
+
+def bulk_delete(
+    item_ids: list[str],
+    archive: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY
+) -> list[tuple[bool, bytes, str]]:
+    """Delete (or archive) many items by ID concurrently."""
+    suffix = ["--archive"] if archive else []
+    return run_many([["item", "delete", item_id, *suffix] for item_id in item_ids], concurrency)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Apply many 1Password updates and deletes in one run.
+
+Usage:
+    python3 op_batch.py ops.json
+    python3 op_batch.py ops.json --force
+    cat ops.json | python3 op_batch.py -
+
+Batch File Format (JSON array):
+    [
+      {"op": "update", "vault": "Dev", "item": "API Key", "password": "new-secret"},
+      {"op": "update", "id": "abc123xyz", "fields": ["host=db.example.com"]},
+      {"op": "delete", "id": "def456uvw", "archive": true}
+    ]
+
+    update accepts the same keys as op_update.py: vault, item, id, username,
+    password, url, fields, generate, title, tags.
+    delete accepts: vault, item, id, archive.
+
+Options:
+    --force               Perform deletes (without it, deletes are only reported)
+    --workers <n>         Concurrent op calls (default: 8)
+    --retries <n>         Retries for rate-limited updates; deletes are never retried (default: 2)
+"""
+
+import sys
+from functools import cache
+
+from op_async import run_many
+from op_common import emit, ensure_authenticated, loads, resolve_vault
+from op_delete import build_delete_args, forget_item_info
+from op_update import build_update_args
+
+_UPDATE_KEYS = {"vault", "item", "id", "username", "password", "url", "fields", "generate", "title", "tags"}
+_DELETE_KEYS = {"vault", "item", "id", "archive"}
+
+
+def plan_operation(operation: dict, force: bool = False) -> tuple[list[str] | None, dict, str]:
+    """Turn a batch entry into op arguments; entries that need no op call get a result or error instead."""
+    kind = operation.get("op")
+
+    if kind == "update":
+        unknown = operation.keys() - _UPDATE_KEYS - {"op"}
+        if unknown:
+            return None, {}, f"Unknown update keys: {', '.join(sorted(unknown))}"
+
+        args, error = build_update_args(
+            vault=operation.get("vault"),
+            item=operation.get("item"),
+            item_id=operation.get("id"),
+            username=operation.get("username"),
+            password=operation.get("password"),
+            url=operation.get("url"),
+            fields=operation.get("fields"),
+            generate_password=operation.get("generate", False),
+            title=operation.get("title"),
+            tags=operation.get("tags")
+        )
+        return args, {}, error
+
+    if kind == "delete":
+        unknown = operation.keys() - _DELETE_KEYS - {"op"}
+        if unknown:
+            return None, {}, f"Unknown delete keys: {', '.join(sorted(unknown))}"
+
+        action = "archive" if operation.get("archive") else "delete"
+        if not force:
+            return None, {"skipped": True, "hint": f"Run with --force to confirm {action}"}, ""
+
+        args, error = build_delete_args(
+            vault=operation.get("vault"),
+            item=operation.get("item"),
+            item_id=operation.get("id"),
+            archive=operation.get("archive", False)
+        )
+        return args, {}, error
+
+    return None, {}, f"Unknown op: {kind!r} (use update or delete)"
+
+
+def summarize(operation: dict, output: bytes) -> tuple[bool, dict, str]:
+    """Build the per-entry result from a successful op call."""
+    if operation["op"] == "delete":
+        forget_item_info(vault=operation.get("vault"), item=operation.get("item"), item_id=operation.get("id"))
+        return True, {"action": "archived" if operation.get("archive") else "deleted"}, ""
+
+    try:
+        item = loads(output) if output and not output.isspace() else {}
+    except ValueError as e:
+        return False, {}, f"Failed to parse response: {e}"
+
+    return True, {
+        "id": item.get("id"),
+        "title": item.get("title"),
+        "vault": item.get("vault", {}).get("name"),
+        "updated_at": item.get("updated_at")
+    }, ""
+
+
+def run_batch(operations: list[dict], force: bool = False, workers: int = 8, retries: int = 2) -> list[dict]:
+    """Run all operations concurrently and return one result per entry, in order."""
+    plans = []
+    for operation in operations:
+        plan = plan_operation(operation, force)
+        # Only entries that will call op get their vault name resolved to an ID
+        # (once per distinct name), so op doesn't redo the lookup per item.
+        # The operation itself keeps the name: op_delete's cache is keyed by it
+        if plan[0] is not None and operation.get("vault"):
+            success, vault_id, _ = resolve_vault(operation["vault"])
+            if success:
+                plan = plan_operation({**operation, "vault": vault_id}, force)
+        plans.append(plan)
+
+    commands = [args for args, _, _ in plans if args is not None]
+    outcomes = iter(run_many(commands, concurrency=workers, retries=retries))
+
+    results = []
+    for index, (operation, (args, result, error)) in enumerate(zip(operations, plans)):
+        if args is not None:
+            success, output, error = next(outcomes)
+            if success:
+                success, result, error = summarize(operation, output)
+        else:
+            success = not error
+
+        entry = {"index": index, "op": operation.get("op"), "success": success}
+        entry.update(result if success else {"error": error})
+        results.append(entry)
+
+    return results
+
+
+@cache
+def _parser():
+    """Build the argument parser once; argparse is only imported when parsing."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Batch update and delete 1Password items")
+    parser.add_argument("batch_file", help="JSON file with a list of operations (- for stdin)")
+    parser.add_argument("--force", action="store_true", help="Perform deletes")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent op calls")
+    parser.add_argument("--retries", type=int, default=2, help="Retries for rate-limited updates")
+    return parser
+
+
+def main():
+    parser = _parser()
+    args = parser.parse_args()
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.retries < 0:
+        parser.error("--retries must not be negative")
+
+    try:
+        if args.batch_file == "-":
+            operations = loads(sys.stdin.buffer.read())
+        else:
+            with open(args.batch_file, "rb") as f:
+                operations = loads(f.read())
+    except (OSError, ValueError) as e:
+        emit({"error": f"Failed to read batch file: {e}"}, pretty=False, file=sys.stderr)
+        sys.exit(1)
+
+    if not isinstance(operations, list) or not all(isinstance(op, dict) for op in operations):
+        emit({"error": "Batch file must contain a JSON array of objects"}, pretty=False, file=sys.stderr)
+        sys.exit(1)
+
+    success, error = ensure_authenticated()
+    if not success:
+        emit({"error": error}, pretty=False, file=sys.stderr)
+        sys.exit(1)
+
+    results = run_batch(operations, force=args.force, workers=args.workers, retries=args.retries)
+
+    emit(results)
+    sys.exit(0 if all(result["success"] for result in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,44 +3,61 @@
 Verify 1Password CLI installation and authentication status.
 
 Usage:
-    python3 op_check.py [--json]
+    python3 op_check.py [--json] [--no-cache] [--refresh-async]
 
 Options:
-    --json    Output results as JSON
+    --json             Output results as JSON
+    --no-cache         Ignore cached results and re-run all checks (JSON mode)
+    --refresh-async    Print stale cached results immediately and refresh the
+                       cache in the background (JSON mode)
 """
 
+import io
+import os
 import subprocess
 import sys
-import json
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 
+from op_common import CACHE_PRUNE_AGE, emit, loads, read_cache, write_cache
 
-def run_op_command(args: list[str]) -> tuple[bool, str]:
-    """Run an op command and return success status and output."""
+try:
+    import ijson
+    _PARSE_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _PARSE_ERRORS = (ValueError,)
+
+STREAM_PARSE_MIN_BYTES = 64 * 1024
+CACHE_TTL = 60  # seconds
+
+
+def run_op_command(args: list[str]) -> tuple[bool, bytes]:
+    """Run an op command and return success status and raw output bytes."""
     try:
         result = subprocess.run(
             ["op"] + args,
             capture_output=True,
-            text=True,
             timeout=30
         )
-        return result.returncode == 0, result.stdout.strip()
+        return result.returncode == 0, result.stdout
     except FileNotFoundError:
-        return False, "1Password CLI not found"
+        return False, b"1Password CLI not found"
     except subprocess.TimeoutExpired:
-        return False, "Command timed out"
+        return False, b"Command timed out"
     except Exception as e:
-        return False, str(e)
+        return False, str(e).encode()
 
 
 def check_cli_installed() -> tuple[bool, str]:
     """Check if 1Password CLI is installed."""
+    import shutil
+    
     if shutil.which("op") is None:
         return False, "Not installed"
     
     success, output = run_op_command(["--version"])
     if success:
-        return True, output
+        return True, output.decode("utf-8").strip()
     return False, "Unable to get version"
 
 
@@ -52,31 +69,69 @@ def check_authenticated() -> tuple[bool, str, list[dict]]:
         return False, "Not authenticated", []
     
     try:
-        accounts = json.loads(output) if output else []
+        accounts = loads(output) if output and not output.isspace() else []
         if not accounts:
             return False, "No accounts configured", []
         return True, f"{len(accounts)} account(s)", accounts
-    except json.JSONDecodeError:
+    except ValueError:
         return False, "Invalid response", []
 
 
 def check_vaults() -> tuple[bool, int, list[dict]]:
-    """Check accessible vaults."""
+    """Check accessible vaults, keeping only each vault's id and name."""
     success, output = run_op_command(["vault", "list", "--format", "json"])
     
     if not success:
         return False, 0, []
     
     try:
-        vaults = json.loads(output) if output else []
+        if ijson is not None and len(output) >= STREAM_PARSE_MIN_BYTES:
+            # Stream large lists so full vault records are never materialized
+            records = ijson.items(io.BytesIO(output), "item")
+        else:
+            records = loads(output) if output and not output.isspace() else []
+        vaults = [{"id": v.get("id"), "name": v.get("name")} for v in records]
         return True, len(vaults), vaults
-    except json.JSONDecodeError:
+    except _PARSE_ERRORS:
         return False, 0, []
 
 
+def load_cached_results(max_age: float = CACHE_TTL) -> dict:
+    """Return cached results of the last ready check, or None if missing/stale."""
+    # Entries are scoped to the active account/token, so switching identity misses
+    return read_cache("op_check", "results", max_age if max_age is not None else CACHE_PRUNE_AGE)
+
+
+def save_cached_results(results: dict) -> None:
+    """Persist results of a ready check (metadata only, never secrets)."""
+    write_cache("op_check", "results", results)
+
+
+def refresh_cache_async() -> None:
+    """Re-run the checks in a detached process that rewrites the cache."""
+    subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--json", "--no-cache"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
 def main():
     output_json = "--json" in sys.argv
     
+    # Serve a recent successful result without spawning op at all
+    if output_json and "--no-cache" not in sys.argv:
+        cached = load_cached_results()
+        if cached is None and "--refresh-async" in sys.argv:
+            cached = load_cached_results(max_age=None)
+            if cached is not None:
+                refresh_cache_async()
+        if cached is not None:
+            emit(cached)
+            sys.exit(0)
+    
     results = {
         "cli_installed": False,
         "cli_version": None,
@@ -88,14 +143,21 @@ def main():
         "ready": False
     }
     
+    # Run all three checks concurrently; each one is dominated by op's
+    # process startup, so overlapping them bounds wall time by the slowest.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        installed_future = executor.submit(check_cli_installed)
+        auth_future = executor.submit(check_authenticated)
+        vaults_future = executor.submit(check_vaults)
+    
     # Check CLI installation
-    installed, version = check_cli_installed()
+    installed, version = installed_future.result()
     results["cli_installed"] = installed
     results["cli_version"] = version if installed else None
     
     if not installed:
         if output_json:
-            print(json.dumps(results, indent=2))
+            emit(results)
         else:
             print("❌ 1Password CLI not installed")
             print("\nInstall with:")
@@ -104,13 +166,13 @@ def main():
         sys.exit(1)
     
     # Check authentication
-    auth_ok, auth_msg, accounts = check_authenticated()
+    auth_ok, auth_msg, accounts = auth_future.result()
     results["authenticated"] = auth_ok
     results["accounts"] = accounts
     
     if not auth_ok:
         if output_json:
-            print(json.dumps(results, indent=2))
+            emit(results)
         else:
             print(f"✅ 1Password CLI installed: {version}")
             print(f"❌ Authentication: {auth_msg}")
@@ -122,14 +184,17 @@ def main():
         sys.exit(1)
     
     # Check vaults
-    vaults_ok, vault_count, vaults = check_vaults()
+    vaults_ok, vault_count, vaults = vaults_future.result()
     results["vaults_accessible"] = vaults_ok
     results["vault_count"] = vault_count
-    results["vaults"] = [{"id": v.get("id"), "name": v.get("name")} for v in vaults]
+    results["vaults"] = vaults
     results["ready"] = True
+    # A failed vault listing may be transient; don't serve it from cache
+    if vaults_ok:
+        save_cached_results(results)
     
     if output_json:
-        print(json.dumps(results, indent=2))
+        emit(results)
     else:
         print(f"✅ 1Password CLI installed: {version}")
         
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the 1Password scripts.
+
+run_op_command wraps the op CLI. Read-only commands get op's --cache flag
+(already op 2.x's default on Unix, so passing it costs no version probe),
+and when OP_CONNECT_HOST and OP_CONNECT_TOKEN are set, vault and item
+listings are answered by the 1Password Connect server over a kept-alive
+HTTP connection instead of spawning op at all.
+
+read_cache/write_cache keep small metadata (never secret values) in
+~/.cache/cursor-skills so repeated invocations can skip an op call.
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+from functools import cache, lru_cache
+from pathlib import Path
+
+# subprocess, http.client, urllib.parse and hashlib are imported where used:
+# --help and argument errors never touch them, and http.client alone costs
+# more startup than the rest of this module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+loads = orjson.loads if orjson is not None else json.loads
+
+
+def dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None).encode()
+
+
+def emit(obj, pretty: bool = True, file=None) -> None:
+    """Write obj as JSON bytes straight to stdout (or file)."""
+    buffer = (file or sys.stdout).buffer
+    buffer.write(dumps(obj, pretty))
+    buffer.write(b"\n")
+
+
+# Subcommands that change vault contents and must never be served from cache
+_WRITE_COMMANDS = {"create", "edit", "delete"}
+
+
+def _op_argv(args: list[str]) -> list[str]:
+    """Build the full op command line, adding --cache to read-only item/vault commands."""
+    command = ["op"] + args
+    if args[:1] in (["item"], ["vault"]) and args[1:2] and args[1] not in _WRITE_COMMANDS:
+        command.insert(1, "--cache")
+    return command
+
+
+def run_op_command(args: list[str], input: bytes = None) -> tuple[bool, bytes, str]:
+    """Run an op command and return success, raw stdout bytes, stderr."""
+    import subprocess
+
+    if os.environ.get("OP_CONNECT_HOST") and os.environ.get("OP_CONNECT_TOKEN"):
+        handled = _connect_command(args)
+        if handled is not None:
+            return handled
+
+    try:
+        process = subprocess.Popen(
+            _op_argv(args),
+            stdin=subprocess.PIPE if input is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+    except FileNotFoundError:
+        return False, b"", "1Password CLI not found. Install with: brew install --cask 1password-cli"
+    except Exception as e:
+        return False, b"", str(e)
+
+    # Keep stdout as raw bytes: json.loads takes them directly, no decode + strip copies
+    try:
+        stdout, stderr = process.communicate(input, timeout=60)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        return False, b"", "Command timed out"
+
+    return process.returncode == 0, stdout, stderr.decode("utf-8", "replace").strip()
+
+
+def stream_op_records(args: list[str], keys: tuple[str, ...]) -> tuple[bool, list[dict], str] | None:
+    """Stream-parse a JSON array from op's stdout, keeping only `keys` of each record.
+
+    Returns None when ijson isn't installed or Connect is configured, so the
+    caller can fall back to run_op_command.
+    """
+    import subprocess
+
+    try:
+        import ijson
+    except ImportError:
+        return None
+    if os.environ.get("OP_CONNECT_HOST") and os.environ.get("OP_CONNECT_TOKEN"):
+        return None
+
+    try:
+        process = subprocess.Popen(_op_argv(args), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError:
+        return False, [], "1Password CLI not found. Install with: brew install --cask 1password-cli"
+    except Exception as e:
+        return False, [], str(e)
+
+    # Drain stderr alongside stdout so a chatty op can't fill that pipe and
+    # stall, and kill op if the whole read overruns, as communicate(timeout=60)
+    # does in run_op_command
+    stderr_chunks = []
+    drain = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True)
+    timed_out = threading.Event()
+
+    def kill_on_timeout():
+        timed_out.set()
+        process.kill()
+
+    timer = threading.Timer(60, kill_on_timeout)
+    timer.daemon = True
+    drain.start()
+    timer.start()
+
+    # Records are projected as they arrive, so the full JSON tree never exists in memory
+    with process:
+        try:
+            records = [{key: record.get(key) for key in keys} for record in ijson.items(process.stdout, "item")]
+            parse_error = ""
+        except (ValueError, ijson.JSONError) as e:
+            records, parse_error = [], f"Failed to parse response: {e}"
+        # Closing stdout first lets an op we stopped reading exit on EPIPE
+        process.stdout.close()
+        drain.join()
+        process.wait()
+    timer.cancel()
+
+    stderr = b"".join(stderr_chunks)
+    if timed_out.is_set():
+        return False, [], "Command timed out"
+    if process.returncode != 0:
+        return False, [], stderr.decode("utf-8", "replace").strip()
+    if parse_error:
+        return False, [], parse_error
+    return True, records, ""
+
+
+# key=value with no "[" anywhere; fields using fieldname[type]=value syntax don't match
+_FIELD_RE = re.compile(r"([^\[=]*)=([^\[]*)\Z", re.DOTALL)
+
+
+def format_field(field: str) -> str:
+    """Turn a custom key=value field into an op assignment, typing plain fields as [text]."""
+    match = _FIELD_RE.match(field)
+    return f"{match[1]}[text]={match[2]}" if match else field
+
+
+@lru_cache(maxsize=32)
+def _field_template(keys: tuple[str, ...]):
+    """Precompute the assignment prefixes for one set of field names."""
+    prefixes = tuple(f"{key}[text]=" for key in keys)
+    return lambda values: [prefix + value for prefix, value in zip(prefixes, values)]
+
+
+def format_fields(fields: list[str]) -> list[str]:
+    """format_field over many fields, reusing a cached template when every field is plain key=value."""
+    matches = [_FIELD_RE.match(field) for field in fields]
+    if not all(matches):
+        return [f"{m[1]}[text]={m[2]}" if m else field for m, field in zip(matches, fields)]
+    return _field_template(tuple(m[1] for m in matches))([m[2] for m in matches])
+
+
+# Vault IDs are 26 lowercase alphanumerics; anything else is a name op must look up
+_VAULT_ID_RE = re.compile(r"[a-z0-9]{26}")
+
+
+@cache
+def ensure_authenticated() -> tuple[bool, str]:
+    """Check once per process that op is signed in, before fanning out many calls."""
+    # Connect authenticates each request with its token; there is no op session to check
+    if os.environ.get("OP_CONNECT_HOST") and os.environ.get("OP_CONNECT_TOKEN"):
+        return True, ""
+
+    success, output, error = run_op_command(["whoami", "--format", "json"])
+    if not success:
+        return False, error or "Not signed in to 1Password"
+    return True, ""
+
+
+@cache
+def resolve_vault(vault: str) -> tuple[bool, str, str]:
+    """Resolve a vault name to its ID once per process so repeated calls skip op's lookup."""
+    if _VAULT_ID_RE.fullmatch(vault):
+        return True, vault, ""
+
+    success, output, error = run_op_command(["vault", "get", vault, "--format", "json"])
+    if not success:
+        return False, "", error
+
+    try:
+        return True, loads(output)["id"], ""
+    except (ValueError, KeyError, TypeError) as e:
+        return False, "", f"Failed to parse vault: {e}"
+
+
+# Metadata cache
+
+CACHE_DIR = Path.home() / ".cache" / "cursor-skills"
+CACHE_PRUNE_AGE = 3600  # seconds; longer than any TTL callers use
+
+_cache_lock = threading.Lock()
+
+
+@cache
+def _cache_scope() -> str:
+    """Fingerprint the active account/credentials so cache entries never cross them."""
+    import hashlib
+
+    identity = "\0".join(os.environ.get(name, "") for name in (
+        "OP_ACCOUNT", "OP_SERVICE_ACCOUNT_TOKEN", "OP_CONNECT_HOST", "OP_CONNECT_TOKEN"
+    ))
+    return hashlib.sha256(identity.encode()).hexdigest()[:16]
+
+
+def _read_cache_file(name: str) -> dict:
+    try:
+        entries = loads((CACHE_DIR / f"{name}.json").read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def read_cache(name: str, key: str, max_age: float):
+    """Return a cached value younger than max_age seconds, or None."""
+    entry = _read_cache_file(name).get(f"{_cache_scope()}:{key}")
+    if not entry or time.time() - entry.get("timestamp", 0) > max_age:
+        return None
+    return entry.get("value")
+
+
+def write_cache(name: str, key: str, value) -> None:
+    """Store a value (metadata only, never secrets); None drops the entry."""
+    path = CACHE_DIR / f"{name}.json"
+    now = time.time()
+
+    with _cache_lock:
+        entries = {
+            k: entry for k, entry in _read_cache_file(name).items()
+            if isinstance(entry, dict) and now - entry.get("timestamp", 0) < CACHE_PRUNE_AGE
+        }
+        entries.pop(f"{_cache_scope()}:{key}", None)
+        if value is not None:
+            entries[f"{_cache_scope()}:{key}"] = {"timestamp": now, "value": value}
+
+        # Write to a private temp file and rename, so readers never see a partial file
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(dumps(entries))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+# 1Password Connect
+
+# One keep-alive connection per thread, so concurrent listings (op_list
+# --vaults-file) each reuse their own TCP/TLS session instead of queueing
+# on a single shared one
+_connect_local = threading.local()
+
+# Connect uses camelCase where the CLI's JSON uses snake_case
+_CONNECT_FIELD_NAMES = {
+    "createdAt": "created_at",
+    "updatedAt": "updated_at",
+    "contentVersion": "content_version",
+    "attributeVersion": "attribute_version",
+    "lastEditedBy": "last_edited_by",
+}
+
+
+def _normalize_connect(record: dict) -> dict:
+    """Rename Connect's camelCase keys to the CLI's snake_case ones."""
+    return {_CONNECT_FIELD_NAMES.get(key, key): value for key, value in record.items()}
+
+
+def _connect_get(path: str) -> tuple[bool, object, str]:
+    """GET a Connect API path over this thread's keep-alive connection."""
+    import http.client
+    import urllib.parse
+
+    host = urllib.parse.urlsplit(os.environ["OP_CONNECT_HOST"])
+    headers = {"Authorization": f"Bearer {os.environ['OP_CONNECT_TOKEN']}", "Accept": "application/json"}
+
+    for attempt in range(2):
+        conn = getattr(_connect_local, "conn", None)
+        if conn is None:
+            conn_class = http.client.HTTPSConnection if host.scheme == "https" else http.client.HTTPConnection
+            conn = _connect_local.conn = conn_class(host.netloc, timeout=60)
+        try:
+            conn.request("GET", host.path.rstrip("/") + path, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+            break
+        except (OSError, http.client.HTTPException) as e:
+            # The server may have dropped an idle keep-alive connection; reconnect once
+            conn.close()
+            _connect_local.conn = None
+            if attempt:
+                return False, None, f"Connect request failed: {e}"
+
+    try:
+        data = loads(body) if body else None
+    except ValueError as e:
+        return False, None, f"Failed to parse Connect response: {e}"
+
+    if response.status >= 400:
+        message = data.get("message") if isinstance(data, dict) else None
+        return False, None, message or f"Connect request failed: HTTP {response.status}"
+
+    return True, data, ""
+
+
+_connect_vaults_lock = threading.Lock()
+
+
+def _connect_vaults() -> tuple[bool, object, str]:
+    """Fetch the Connect vault list once per process; every item listing needs it."""
+    # Serialize the first fetch so concurrent listings don't each request it
+    with _connect_vaults_lock:
+        return _fetch_connect_vaults()
+
+
+@cache
+def _fetch_connect_vaults() -> tuple[bool, object, str]:
+    return _connect_get("/v1/vaults")
+
+
+def _connect_vault(vault: str) -> tuple[bool, dict, str]:
+    """Resolve a vault name or ID to its Connect record (item URLs need the ID)."""
+    success, vaults, error = _connect_vaults()
+    if not success:
+        return False, {}, error
+
+    for record in vaults or []:
+        if vault in (record.get("id"), record.get("name")):
+            return True, record, ""
+
+    return False, {}, f"Vault not found: {vault}"
+
+
+def _connect_command(args: list[str]) -> tuple[bool, bytes, str] | None:
+    """Serve read-only listings through Connect; None means fall back to the CLI."""
+    import urllib.parse
+
+    if args[:2] == ["vault", "list"]:
+        success, vaults, error = _connect_vaults()
+        if not success:
+            return False, b"", error
+        return True, dumps([_normalize_connect(v) for v in vaults or []]), ""
+
+    if args[:2] == ["item", "list"] and "--vault" in args:
+        success, vault, error = _connect_vault(args[args.index("--vault") + 1])
+        if not success:
+            return False, b"", error
+
+        success, items, error = _connect_get(f"/v1/vaults/{urllib.parse.quote(vault['id'])}/items")
+        if not success:
+            return False, b"", error
+
+        # Connect item summaries only carry the vault ID; fill in the name like the CLI does
+        vault_ref = {"id": vault["id"], "name": vault.get("name")}
+        return True, dumps([{**_normalize_connect(i), "vault": vault_ref} for i in items or []]), ""
+
+    return None
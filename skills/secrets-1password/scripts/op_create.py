@@ -20,28 +20,10 @@ Options:
     --notes <text>        Notes to add to the item
 """
 
-import subprocess
 import sys
-import json
-import argparse
+from functools import cache
 
-
-def run_op_command(args: list[str]) -> tuple[bool, str, str]:
-    """Run an op command and return success, stdout, stderr."""
-    try:
-        result = subprocess.run(
-            ["op"] + args,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-        return result.returncode == 0, result.stdout.strip(), result.stderr.strip()
-    except FileNotFoundError:
-        return False, "", "1Password CLI not found"
-    except subprocess.TimeoutExpired:
-        return False, "", "Command timed out"
-    except Exception as e:
-        return False, "", str(e)
+from op_common import emit, format_field, loads, run_op_command
 
 
 def create_item(
@@ -63,59 +45,34 @@ def create_item(
         "--category", category,
         "--title", title,
         "--vault", vault,
-        "--format", "json"
+        "--format", "json",
+        *(["--generate-password"] if generate_password else []),
+        *(["--tags", tags] if tags else []),
+        # Field assignments
+        *([f"username={username}"] if username else []),
+        *([f"password={password}"] if password and not generate_password else []),
+        *([f"url={url}"] if url else []),
+        *([f"notesPlain={notes}"] if notes else []),
+        *map(format_field, fields or ()),
     ]
     
-    # Add generate password flag
-    if generate_password:
-        args.append("--generate-password")
-    
-    # Add tags
-    if tags:
-        args.extend(["--tags", tags])
-    
-    # Build field assignments
-    field_assignments = []
-    
-    if username:
-        field_assignments.append(f"username={username}")
-    
-    if password and not generate_password:
-        field_assignments.append(f"password={password}")
-    
-    if url:
-        field_assignments.append(f"url={url}")
-    
-    if notes:
-        field_assignments.append(f"notesPlain={notes}")
-    
-    # Add custom fields
-    if fields:
-        for field in fields:
-            # Handle field type syntax: fieldname[type]=value
-            if "[" not in field and "=" in field:
-                # Add [text] type for plain fields
-                key, value = field.split("=", 1)
-                field_assignments.append(f"{key}[text]={value}")
-            else:
-                field_assignments.append(field)
-    
-    # Append field assignments to args
-    args.extend(field_assignments)
-    
     success, output, error = run_op_command(args)
     
     if not success:
         return False, {}, error
     
     try:
-        item = json.loads(output) if output else {}
+        item = loads(output) if output and not output.isspace() else {}
         return True, item, ""
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         return False, {}, f"Failed to parse response: {e}"
 
 
-def main():
+@cache
+def _parser():
+    """Build the argument parser once; argparse is only imported when parsing."""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="Create new 1Password items")
     parser.add_argument("--vault", type=str, required=True, help="Vault name or ID")
     parser.add_argument("--title", type=str, required=True, help="Item title")
@@ -129,7 +86,11 @@ def main():
     parser.add_argument("--generate", action="store_true", help="Generate random password")
     parser.add_argument("--tags", type=str, help="Comma-separated tags")
     parser.add_argument("--notes", type=str, help="Notes")
-    
+    return parser
+
+
+def main():
+    parser = _parser()
     args = parser.parse_args()
     
     # Validate
@@ -150,7 +111,7 @@ def main():
     )
     
     if not success:
-        print(json.dumps({"error": error}), file=sys.stderr)
+        emit({"error": error}, pretty=False, file=sys.stderr)
         sys.exit(1)
     
     # Output created item (without exposing secrets)
@@ -164,7 +125,7 @@ def main():
         "reference": f"op://{args.vault}/{args.title}/password"
     }
     
-    print(json.dumps(result, indent=2))
+    emit(result)
     sys.exit(0)
 
 
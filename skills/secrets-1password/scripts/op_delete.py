@@ -6,6 +6,7 @@ Usage:
     python3 op_delete.py --vault "Vault" --item "Item Name"
     python3 op_delete.py --id "item-id"
     python3 op_delete.py --vault "Vault" --item "Item Name" --force
+    python3 op_delete.py --id "item-id" --force --passthrough
 
 Options:
     --vault <name>        Vault name or ID
@@ -13,34 +14,21 @@ Options:
     --id <id>             Item ID (alternative to --vault/--item)
     --archive             Archive instead of delete (can be restored)
     --force               Permanently delete without confirmation prompt
+    --passthrough         With --force, exec op directly and let its output and
+                          exit status through (no JSON result)
 """
 
-import subprocess
+import os
 import sys
-import json
-import argparse
+from functools import cache
 
+from op_common import emit, loads, read_cache, run_op_command, write_cache
 
-def run_op_command(args: list[str]) -> tuple[bool, str, str]:
-    """Run an op command and return success, stdout, stderr."""
-    try:
-        result = subprocess.run(
-            ["op"] + args,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-        return result.returncode == 0, result.stdout.strip(), result.stderr.strip()
-    except FileNotFoundError:
-        return False, "", "1Password CLI not found"
-    except subprocess.TimeoutExpired:
-        return False, "", "Command timed out"
-    except Exception as e:
-        return False, "", str(e)
+ITEM_INFO_TTL = 30  # seconds
 
 
 def get_item_info(vault: str = None, item: str = None, item_id: str = None) -> tuple[bool, dict, str]:
-    """Get item info before deletion for confirmation."""
+    """Get item info before deletion for confirmation (cached briefly, metadata only)."""
     args = ["item", "get", "--format", "json"]
     
     if item_id:
@@ -50,88 +38,150 @@ def get_item_info(vault: str = None, item: str = None, item_id: str = None) -> t
     else:
         return False, {}, "Specify either --id or --vault and --item"
     
+    key = item_id or f"{vault}/{item}"
+    cached = read_cache("op_delete", key, ITEM_INFO_TTL)
+    if cached is not None:
+        return True, cached, ""
+    
     success, output, error = run_op_command(args)
     
     if not success:
         return False, {}, error
     
     try:
-        item_data = json.loads(output) if output else {}
-        return True, item_data, ""
-    except json.JSONDecodeError:
+        item_data = loads(output) if output and not output.isspace() else {}
+    except ValueError:
         return False, {}, "Failed to parse item data"
+    
+    # Keep only what the confirmation needs; the full item carries secret values
+    info = {
+        "id": item_data.get("id"),
+        "title": item_data.get("title"),
+        "vault": {"name": item_data.get("vault", {}).get("name")}
+    }
+    write_cache("op_delete", key, info)
+    return True, info, ""
 
 
-def delete_item(
+def forget_item_info(vault: str = None, item: str = None, item_id: str = None) -> None:
+    """Drop cached confirmation info for an item that no longer exists."""
+    write_cache("op_delete", item_id or f"{vault}/{item}", None)
+
+
+def build_delete_args(
     vault: str = None,
     item: str = None,
     item_id: str = None,
     archive: bool = False
-) -> tuple[bool, str]:
-    """Delete or archive an item."""
-    args = ["item", "delete"]
-    
+) -> tuple[list[str] | None, str]:
+    """Build the op item delete arguments, or return None and an error message."""
     if item_id:
-        args.append(item_id)
+        target = [item_id]
     elif vault and item:
-        args.extend([item, "--vault", vault])
+        target = [item, "--vault", vault]
     else:
-        return False, "Specify either --id or --vault and --item"
+        return None, "Specify either --id or --vault and --item"
     
-    if archive:
-        args.append("--archive")
+    return ["item", "delete", *target, *(["--archive"] if archive else [])], ""
+
+
+def delete_item(
+    vault: str = None,
+    item: str = None,
+    item_id: str = None,
+    archive: bool = False
+) -> tuple[bool, str]:
+    """Delete or archive an item."""
+    args, error = build_delete_args(vault=vault, item=item, item_id=item_id, archive=archive)
+    if args is None:
+        return False, error
     
     success, output, error = run_op_command(args)
     
     if not success:
         return False, error
     
+    forget_item_info(vault=vault, item=item, item_id=item_id)
     return True, "Item deleted successfully" if not archive else "Item archived successfully"
 
 
-def main():
+@cache
+def _parser():
+    """Build the argument parser once; argparse is only imported when parsing."""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="Delete 1Password items")
     parser.add_argument("--vault", type=str, help="Vault name or ID")
     parser.add_argument("--item", type=str, help="Item name or title")
     parser.add_argument("--id", type=str, dest="item_id", help="Item ID")
     parser.add_argument("--archive", action="store_true", help="Archive instead of delete")
     parser.add_argument("--force", action="store_true", help="Skip confirmation")
-    
+    parser.add_argument("--passthrough", action="store_true",
+                        help="Replace this process with op item delete (requires --force)")
+    return parser
+
+
+def main():
+    parser = _parser()
     args = parser.parse_args()
     
     # Validate
     if not args.item_id and not (args.vault and args.item):
         parser.error("Specify --id or --vault and --item")
     
-    # Get item info first
-    success, item_info, error = get_item_info(
-        vault=args.vault,
-        item=args.item,
-        item_id=args.item_id
-    )
-    
-    if not success:
-        print(json.dumps({"error": f"Item not found: {error}"}), file=sys.stderr)
-        sys.exit(1)
+    if args.passthrough and not args.force:
+        parser.error("--passthrough requires --force")
     
-    item_title = item_info.get("title", "Unknown")
-    item_vault = item_info.get("vault", {}).get("name", "Unknown")
-    item_id = item_info.get("id", "")
+    # Hand the process over to op when the caller doesn't need a JSON result
+    if args.passthrough:
+        delete_args, _ = build_delete_args(
+            vault=args.vault,
+            item=args.item,
+            item_id=args.item_id,
+            archive=args.archive
+        )
+        forget_item_info(vault=args.vault, item=args.item, item_id=args.item_id)
+        try:
+            os.execvp("op", ["op", *delete_args])
+        except OSError as e:
+            emit({"error": f"Failed to run op: {e}"}, pretty=False, file=sys.stderr)
+            sys.exit(1)
     
     # Confirm deletion (unless --force)
     if not args.force:
+        success, item_info, error = get_item_info(
+            vault=args.vault,
+            item=args.item,
+            item_id=args.item_id
+        )
+        
+        if not success:
+            emit({"error": f"Item not found: {error}"}, pretty=False, file=sys.stderr)
+            sys.exit(1)
+        
         action = "archive" if args.archive else "delete"
-        print(json.dumps({
+        emit({
             "warning": f"About to {action} item",
             "item": {
-                "id": item_id,
-                "title": item_title,
-                "vault": item_vault
+                "id": item_info.get("id", ""),
+                "title": item_info.get("title", "Unknown"),
+                "vault": item_info.get("vault", {}).get("name", "Unknown")
             },
             "hint": f"Run with --force to confirm {action}"
-        }, indent=2))
+        })
         sys.exit(0)
     
+    # Forced deletes skip the lookup: describe the item from a recent
+    # confirmation if one is cached, otherwise from the arguments
+    item_info = read_cache("op_delete", args.item_id or f"{args.vault}/{args.item}", ITEM_INFO_TTL) or {
+        "id": args.item_id,
+        "title": args.item,
+        "vault": {"name": args.vault}
+    }
+    item_title = item_info.get("title") or "Unknown"
+    item_vault = item_info.get("vault", {}).get("name") or "Unknown"
+    item_id = item_info.get("id") or ""
+    
     # Perform deletion
     success, message = delete_item(
         vault=args.vault,
@@ -141,7 +191,7 @@ def main():
     )
     
     if not success:
-        print(json.dumps({"error": message}), file=sys.stderr)
+        emit({"error": message}, pretty=False, file=sys.stderr)
         sys.exit(1)
     
     result = {
@@ -154,7 +204,7 @@ def main():
         }
     }
     
-    print(json.dumps(result, indent=2))
+    emit(result)
     sys.exit(0)
 
 
@@ -6,75 +6,118 @@ Usage:
     python3 op_list.py --vaults
     python3 op_list.py --items --vault "Vault Name"
     python3 op_list.py --items --vault "Vault Name" --category login
+    python3 op_list.py --items --vaults-file vaults.txt
 
 Options:
     --vaults              List all accessible vaults
-    --items               List items (requires --vault)
+    --items               List items (requires --vault or --vaults-file)
     --vault <name>        Vault name or ID
+    --vaults-file <file>  File with one vault name or ID per line (lists all concurrently)
     --category <type>     Filter by category (login, password, etc.)
     --tags <tags>         Filter by tags (comma-separated)
     --json                Output as JSON (default)
     --table               Output as formatted table
+    --no-cache            Skip the 5-minute vault list cache
 """
 
-import subprocess
 import sys
-import json
-import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 
+from op_common import emit, ensure_authenticated, loads, read_cache, run_op_command, stream_op_records, write_cache
 
-def run_op_command(args: list[str]) -> tuple[bool, str, str]:
-    """Run an op command and return success, stdout, stderr."""
-    try:
-        result = subprocess.run(
-            ["op"] + args,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-        return result.returncode == 0, result.stdout.strip(), result.stderr.strip()
-    except FileNotFoundError:
-        return False, "", "1Password CLI not found. Install with: brew install --cask 1password-cli"
-    except subprocess.TimeoutExpired:
-        return False, "", "Command timed out"
-    except Exception as e:
-        return False, "", str(e)
-
-
-def list_vaults() -> tuple[bool, list[dict], str]:
-    """List all accessible vaults."""
+VAULTS_TTL = 300  # seconds
+
+
+def list_vaults(use_cache: bool = True) -> tuple[bool, list[dict], str]:
+    """List all accessible vaults (cached for a few minutes; vaults rarely change)."""
+    if use_cache:
+        cached = read_cache("op_list", "vaults", VAULTS_TTL)
+        if cached is not None:
+            return True, cached, ""
+    
     success, output, error = run_op_command(["vault", "list", "--format", "json"])
     
     if not success:
         return False, [], error
     
     try:
-        vaults = json.loads(output) if output else []
-        return True, vaults, ""
-    except json.JSONDecodeError as e:
+        vaults = loads(output) if output and not output.isspace() else []
+    except ValueError as e:
         return False, [], f"Failed to parse response: {e}"
+    
+    write_cache("op_list", "vaults", vaults)
+    return True, vaults, ""
 
 
-def list_items(vault: str, category: str = None, tags: str = None) -> tuple[bool, list[dict], str]:
-    """List items in a vault."""
-    args = ["item", "list", "--vault", vault, "--format", "json"]
+def _fetch_all_items(vault: str) -> tuple[bool, tuple[dict, ...], str]:
+    """Fetch every item in a vault with a single op call."""
+    success, output, error = run_op_command(["item", "list", "--vault", vault, "--format", "json"])
     
-    if category:
-        args.extend(["--categories", category])
+    if not success:
+        return False, (), error
     
-    if tags:
-        args.extend(["--tags", tags])
+    try:
+        return True, tuple(loads(output) if output and not output.isspace() else ()), ""
+    except ValueError as e:
+        return False, (), f"Failed to parse response: {e}"
+
+
+def list_vault_rows(use_cache: bool = True) -> tuple[bool, list[dict], str]:
+    """List just each vault's name and id, stream-parsing op's output when ijson is available."""
+    if use_cache:
+        cached = read_cache("op_list", "vaults", VAULTS_TTL)
+        if cached is not None:
+            return True, cached, ""
+    
+    streamed = stream_op_records(["vault", "list", "--format", "json"], ("name", "id"))
+    if streamed is not None:
+        return streamed
+    return list_vaults(use_cache=use_cache)
+
+
+def _normalize_category(category: str) -> str:
+    """Map user input like "login" or "Secure Note" onto op's LOGIN / SECURE_NOTE."""
+    return category.strip().upper().replace(" ", "_")
+
+
+def list_items(vault: str, category: str = None, tags: str = None) -> tuple[bool, list[dict], str]:
+    """List items in a vault, filtering by category and tags client-side."""
+    success, items, error = _fetch_all_items(vault)
     
-    success, output, error = run_op_command(args)
+    if not success:
+        return False, [], error
     
+    categories = {_normalize_category(c) for c in category.split(",")} if category else None
+    wanted_tags = {t.strip() for t in tags.split(",")} if tags else None
+    
+    return True, [
+        item for item in items
+        if (not categories or item.get("category", "") in categories)
+        and (not wanted_tags or wanted_tags <= set(item.get("tags", ())))
+    ], ""
+
+
+def list_items_bulk(vaults: list[str], category: str = None, tags: str = None) -> tuple[bool, list[dict], str]:
+    """List items across many vaults concurrently and merge the results."""
+    # Check the session once up front instead of letting every worker hit the same auth failure
+    success, error = ensure_authenticated()
     if not success:
         return False, [], error
     
-    try:
-        items = json.loads(output) if output else []
-        return True, items, ""
-    except json.JSONDecodeError as e:
-        return False, [], f"Failed to parse response: {e}"
+    # A vault listed more than once is only fetched once
+    unique_vaults = list(dict.fromkeys(vaults))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = dict(zip(unique_vaults, executor.map(lambda vault: list_items(vault, category, tags), unique_vaults)))
+    
+    merged = []
+    for vault in vaults:
+        success, items, error = results[vault]
+        if not success:
+            return False, [], f"{vault}: {error}"
+        merged.extend(items)
+    
+    return True, merged, ""
 
 
 def format_table(data: list[dict], columns: list[str]) -> str:
@@ -82,69 +125,87 @@ def format_table(data: list[dict], columns: list[str]) -> str:
     if not data:
         return "No items found."
     
-    # Calculate column widths
-    widths = {col: len(col) for col in columns}
+    # Stringify each cell once, tracking column widths as we go
+    widths = [len(col) for col in columns]
+    rendered = []
     for row in data:
-        for col in columns:
-            val = str(row.get(col, ""))
-            widths[col] = max(widths[col], len(val))
-    
-    # Build table
-    lines = []
+        cells = [str(row.get(col, "")) for col in columns]
+        for i, cell in enumerate(cells):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+        rendered.append(cells)
     
-    # Header
-    header = " | ".join(col.ljust(widths[col]) for col in columns)
-    lines.append(header)
-    lines.append("-" * len(header))
-    
-    # Rows
-    for row in data:
-        line = " | ".join(str(row.get(col, "")).ljust(widths[col]) for col in columns)
-        lines.append(line)
+    fmt = " | ".join(f"{{:<{width}}}" for width in widths)
+    header = fmt.format(*columns)
     
-    return "\n".join(lines)
+    return "\n".join([header, "-" * len(header), *(fmt.format(*cells) for cells in rendered)])
 
 
-def main():
+@cache
+def _parser():
+    """Build the argument parser once; argparse is only imported when parsing."""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="List 1Password vaults and items")
     parser.add_argument("--vaults", action="store_true", help="List all vaults")
     parser.add_argument("--items", action="store_true", help="List items in a vault")
     parser.add_argument("--vault", type=str, help="Vault name or ID")
+    parser.add_argument("--vaults-file", type=str, help="File with one vault per line")
     parser.add_argument("--category", type=str, help="Filter by category")
     parser.add_argument("--tags", type=str, help="Filter by tags (comma-separated)")
     parser.add_argument("--json", action="store_true", default=True, help="Output as JSON (default)")
     parser.add_argument("--table", action="store_true", help="Output as table")
-    
+    parser.add_argument("--no-cache", action="store_true", help="Skip the vault list cache")
+    return parser
+
+
+def main():
+    parser = _parser()
     args = parser.parse_args()
     
     # Validate arguments
     if not args.vaults and not args.items:
         parser.error("Specify --vaults or --items")
     
-    if args.items and not args.vault:
-        parser.error("--items requires --vault")
+    if args.items and not (args.vault or args.vaults_file):
+        parser.error("--items requires --vault or --vaults-file")
     
     # List vaults
     if args.vaults:
-        success, vaults, error = list_vaults()
+        if args.table:
+            # The table only shows name and id, so don't materialize full records
+            success, vaults, error = list_vault_rows(use_cache=not args.no_cache)
+        else:
+            success, vaults, error = list_vaults(use_cache=not args.no_cache)
         
         if not success:
-            print(json.dumps({"error": error}), file=sys.stderr)
+            emit({"error": error}, pretty=False, file=sys.stderr)
             sys.exit(1)
         
         if args.table:
             print(format_table(vaults, ["name", "id"]))
         else:
-            print(json.dumps(vaults, indent=2))
+            emit(vaults)
         
         sys.exit(0)
     
     # List items
     if args.items:
-        success, items, error = list_items(args.vault, args.category, args.tags)
+        if args.vaults_file:
+            try:
+                with open(args.vaults_file) as f:
+                    vaults = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+            except OSError as e:
+                emit({"error": f"Failed to read vaults file: {e}"}, pretty=False, file=sys.stderr)
+                sys.exit(1)
+            if args.vault:
+                vaults.insert(0, args.vault)
+            success, items, error = list_items_bulk(vaults, args.category, args.tags)
+        else:
+            success, items, error = list_items(args.vault, args.category, args.tags)
         
         if not success:
-            print(json.dumps({"error": error}), file=sys.stderr)
+            emit({"error": error}, pretty=False, file=sys.stderr)
             sys.exit(1)
         
         if args.table:
@@ -162,7 +223,7 @@ def main():
                 }
                 for item in items
             ]
-            print(json.dumps(simplified, indent=2))
+            emit(simplified)
         
         sys.exit(0)
 
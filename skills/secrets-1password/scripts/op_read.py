@@ -7,48 +7,74 @@ Usage:
     python3 op_read.py --vault "Vault" --item "Item Name" --field password
     python3 op_read.py --id "item-id"
     python3 op_read.py --reference "op://Vault/Item/field"
+    python3 op_read.py --references refs.txt
 
 Options:
     --vault <name>        Vault name or ID
     --item <name>         Item name or title
     --id <id>             Item ID (alternative to --vault/--item)
     --reference <ref>     Secret reference URI (op://vault/item/field)
+    --references <file>   File of KEY=op://vault/item/field lines, resolved in one op call
     --field <name>        Get specific field value only
     --reveal              Include secret values in output (CAUTION: exposes secrets)
 """
 
-import subprocess
 import sys
-import json
-import argparse
+from functools import cache
 
-
-def run_op_command(args: list[str]) -> tuple[bool, str, str]:
-    """Run an op command and return success, stdout, stderr."""
-    try:
-        result = subprocess.run(
-            ["op"] + args,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-        return result.returncode == 0, result.stdout.strip(), result.stderr.strip()
-    except FileNotFoundError:
-        return False, "", "1Password CLI not found"
-    except subprocess.TimeoutExpired:
-        return False, "", "Command timed out"
-    except Exception as e:
-        return False, "", str(e)
+from op_common import emit, loads, run_op_command
 
 
 def read_by_reference(reference: str) -> tuple[bool, str, str]:
     """Read a secret by reference URI."""
     success, output, error = run_op_command(["read", reference])
-    return success, output, error
+    return success, output.decode("utf-8").strip(), error
 
 
-def get_item(vault: str = None, item: str = None, item_id: str = None) -> tuple[bool, dict, str]:
-    """Get full item details."""
+def read_references(path: str) -> tuple[bool, dict, str]:
+    """Resolve every KEY=op://... line of a file with a single op inject call."""
+    import secrets
+    from pathlib import Path
+    
+    try:
+        lines = Path(path).read_text().splitlines()
+    except OSError as e:
+        return False, {}, f"Failed to read references file: {e}"
+    
+    references = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, sep, ref = line.partition("=")
+        if not sep or not ref.strip().startswith("op://"):
+            return False, {}, f"Invalid reference line: {line}. Use KEY=op://vault/item/field"
+        references[key.strip()] = ref.strip()
+    
+    if not references:
+        return True, {}, ""
+    
+    # Each distinct reference is injected once, however many keys share it;
+    # values are separated by a random boundary so multi-line secrets survive
+    unique_refs = list(dict.fromkeys(references.values()))
+    boundary = f"\n--op-read-{secrets.token_hex(16)}--\n"
+    template = boundary.join(f"{{{{ {ref} }}}}" for ref in unique_refs)
+    
+    success, output, error = run_op_command(["inject"], input=template.encode("utf-8"))
+    
+    if not success:
+        return False, {}, error
+    
+    values = output.decode("utf-8").split(boundary)
+    if len(values) != len(unique_refs):
+        return False, {}, "Unexpected op inject output"
+    
+    values_by_ref = dict(zip(unique_refs, values))
+    return True, {key: values_by_ref[ref] for key, ref in references.items()}, ""
+
+
+def get_item_raw(vault: str = None, item: str = None, item_id: str = None) -> tuple[bool, bytes, str]:
+    """Get full item details as op's unparsed JSON bytes."""
     args = ["item", "get", "--format", "json"]
     
     if item_id:
@@ -56,17 +82,22 @@ def get_item(vault: str = None, item: str = None, item_id: str = None) -> tuple[
     elif vault and item:
         args.extend([item, "--vault", vault])
     else:
-        return False, {}, "Specify either --id or --vault and --item"
+        return False, b"", "Specify either --id or --vault and --item"
     
-    success, output, error = run_op_command(args)
+    return run_op_command(args)
+
+
+def get_item(vault: str = None, item: str = None, item_id: str = None) -> tuple[bool, dict, str]:
+    """Get full item details."""
+    success, output, error = get_item_raw(vault=vault, item=item, item_id=item_id)
     
     if not success:
         return False, {}, error
     
     try:
-        item_data = json.loads(output) if output else {}
+        item_data = loads(output) if output and not output.isspace() else {}
         return True, item_data, ""
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         return False, {}, f"Failed to parse response: {e}"
 
 
@@ -85,63 +116,84 @@ def get_field_value(vault: str = None, item: str = None, item_id: str = None, fi
         args.extend(["--fields", field])
     
     success, output, error = run_op_command(args)
-    return success, output, error
+    return success, output.decode("utf-8").strip(), error
 
 
 def redact_secrets(item: dict) -> dict:
     """Redact secret values from item for safe output."""
-    redacted = item.copy()
-    
-    if "fields" in redacted:
-        redacted_fields = []
-        for field in redacted["fields"]:
-            field_copy = field.copy()
-            field_type = field.get("type", "")
-            
-            # Redact concealed/password fields
-            if field_type == "CONCEALED" or field.get("purpose") == "PASSWORD":
-                if "value" in field_copy:
-                    field_copy["value"] = "••••••••"
-                    field_copy["redacted"] = True
-            
-            redacted_fields.append(field_copy)
-        
-        redacted["fields"] = redacted_fields
+    fields = item.get("fields")
+    if not fields:
+        return item
+    
+    # Only concealed/password fields are copied; the rest are shared read-only
+    redacted_fields = [
+        {**field, "value": "••••••••", "redacted": True}
+        if (field.get("type") == "CONCEALED" or field.get("purpose") == "PASSWORD") and "value" in field
+        else field
+        for field in fields
+    ]
     
-    return redacted
+    return {**item, "fields": redacted_fields}
 
 
-def main():
+@cache
+def _parser():
+    """Build the argument parser once; argparse is only imported when parsing."""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="Read secrets from 1Password")
     parser.add_argument("--vault", type=str, help="Vault name or ID")
     parser.add_argument("--item", type=str, help="Item name or title")
     parser.add_argument("--id", type=str, dest="item_id", help="Item ID")
     parser.add_argument("--reference", type=str, help="Secret reference (op://vault/item/field)")
+    parser.add_argument("--references", type=str, help="File of KEY=op://vault/item/field lines")
     parser.add_argument("--field", type=str, help="Get specific field only")
     parser.add_argument("--reveal", action="store_true", help="Include secret values (CAUTION)")
-    
+    return parser
+
+
+def main():
+    parser = _parser()
     args = parser.parse_args()
     
     # Validate arguments
-    if not any([args.reference, args.item_id, (args.vault and args.item)]):
-        parser.error("Specify --reference, --id, or --vault and --item")
+    if not any([args.reference, args.references, args.item_id, (args.vault and args.item)]):
+        parser.error("Specify --reference, --references, --id, or --vault and --item")
+    
+    # Read many references in one op call
+    if args.references:
+        success, values, error = read_references(args.references)
+        
+        if not success:
+            emit({"error": error}, pretty=False, file=sys.stderr)
+            sys.exit(1)
+        
+        if args.reveal:
+            emit({"values": values})
+        else:
+            emit({
+                "values": {key: "••••••••" for key in values},
+                "hint": "Use --reveal to show actual values"
+            })
+        
+        sys.exit(0)
     
     # Read by reference
     if args.reference:
         success, value, error = read_by_reference(args.reference)
         
         if not success:
-            print(json.dumps({"error": error}), file=sys.stderr)
+            emit({"error": error}, pretty=False, file=sys.stderr)
             sys.exit(1)
         
         if args.reveal:
-            print(json.dumps({"reference": args.reference, "value": value}, indent=2))
+            emit({"reference": args.reference, "value": value})
         else:
-            print(json.dumps({
+            emit({
                 "reference": args.reference, 
                 "value": "••••••••",
                 "hint": "Use --reveal to show actual value"
-            }, indent=2))
+            })
         
         sys.exit(0)
     
@@ -155,37 +207,38 @@ def main():
         )
         
         if not success:
-            print(json.dumps({"error": error}), file=sys.stderr)
+            emit({"error": error}, pretty=False, file=sys.stderr)
             sys.exit(1)
         
         if args.reveal:
-            print(json.dumps({"field": args.field, "value": value}, indent=2))
+            emit({"field": args.field, "value": value})
         else:
-            print(json.dumps({
+            emit({
                 "field": args.field,
                 "value": "••••••••",
                 "hint": "Use --reveal to show actual value"
-            }, indent=2))
+            })
         
         sys.exit(0)
     
-    # Get full item
-    success, item, error = get_item(
+    # Get full item (revealed items need no rewriting, so skip the parse)
+    get = get_item_raw if args.reveal else get_item
+    success, item, error = get(
         vault=args.vault,
         item=args.item,
         item_id=args.item_id
     )
     
     if not success:
-        print(json.dumps({"error": error}), file=sys.stderr)
+        emit({"error": error}, pretty=False, file=sys.stderr)
         sys.exit(1)
     
     # Output item
     if args.reveal:
-        print(json.dumps(item, indent=2))
+        sys.stdout.buffer.write(item)
     else:
         redacted = redact_secrets(item)
-        print(json.dumps(redacted, indent=2))
+        emit(redacted)
     
     sys.exit(0)
 
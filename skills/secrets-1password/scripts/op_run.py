@@ -19,12 +19,13 @@ Environment File Format (.env.tpl):
     SECRET_KEY=op://Development/App/secret
 """
 
-import subprocess
 import sys
 import os
-import json
-import argparse
-import tempfile
+import re
+from collections import defaultdict
+from functools import cache
+
+from op_common import emit
 
 
 def run_with_secrets(
@@ -34,6 +35,7 @@ def run_with_secrets(
     no_masking: bool = False
 ) -> tuple[int, str, str]:
     """Run a command with secrets injected from 1Password."""
+    import subprocess
     
     args = ["op", "run"]
     
@@ -45,19 +47,28 @@ def run_with_secrets(
     if no_masking:
         args.append("--no-masking")
     
-    # Handle inline secrets by creating a temporary env file
+    # Handle inline secrets with an in-memory env file (Linux), falling back
+    # to a temporary env file on disk elsewhere
     temp_env_file = None
+    env_fd = None
     if secrets and not env_file:
         try:
-            temp_env_file = tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.env',
-                delete=False
-            )
-            for secret in secrets:
-                temp_env_file.write(f"{secret}\n")
-            temp_env_file.close()
-            args.extend(["--env-file", temp_env_file.name])
+            if hasattr(os, "memfd_create"):
+                env_fd = os.memfd_create("op-env")
+                os.write(env_fd, "".join(f"{secret}\n" for secret in secrets).encode())
+                os.lseek(env_fd, 0, os.SEEK_SET)
+                args.extend(["--env-file", f"/dev/fd/{env_fd}"])
+            else:
+                import tempfile
+                temp_env_file = tempfile.NamedTemporaryFile(
+                    mode='w',
+                    suffix='.env',
+                    delete=False
+                )
+                for secret in secrets:
+                    temp_env_file.write(f"{secret}\n")
+                temp_env_file.close()
+                args.extend(["--env-file", temp_env_file.name])
         except Exception as e:
             return 1, "", f"Failed to create temp env file: {e}"
     
@@ -69,7 +80,8 @@ def run_with_secrets(
         result = subprocess.run(
             args,
             capture_output=False,  # Let output flow through to terminal
-            text=True
+            text=True,
+            pass_fds=(env_fd,) if env_fd is not None else ()
         )
         return result.returncode, "", ""
     except FileNotFoundError:
@@ -77,20 +89,58 @@ def run_with_secrets(
     except Exception as e:
         return 1, "", str(e)
     finally:
-        # Clean up temp file
+        # Clean up in-memory or temp env file
+        if env_fd is not None:
+            os.close(env_fd)
         if temp_env_file and os.path.exists(temp_env_file.name):
             os.unlink(temp_env_file.name)
 
 
-def validate_secret_reference(ref: str) -> bool:
-    """Validate a secret reference format."""
-    if not ref.startswith("op://"):
-        return False
-    parts = ref[5:].split("/")  # Remove "op://" prefix
-    return len(parts) >= 2  # At least vault/item
+# KEY=op://<vault>/<item>...: at least vault/item after the "op://" prefix
+_SECRET_RE = re.compile(r"[^=]*=op://.*/", re.DOTALL)
 
 
-def main():
+def validate_secrets(secrets: list[str]) -> str | None:
+    """Return an error message for the first malformed KEY=ref secret, or None."""
+    for secret in secrets:
+        if _SECRET_RE.match(secret):
+            continue
+        key, sep, ref = secret.partition("=")
+        if not sep:
+            return f"Invalid secret format: {secret}. Use KEY=op://vault/item/field"
+        return f"Invalid secret reference: {ref}. Use op://vault/item/field"
+    return None
+
+
+def find_duplicate_references(env_file: str = None, secrets: list[str] = None) -> dict[str, list[str]]:
+    """Map each secret reference used by more than one variable to those variable names."""
+    # Same precedence as run_with_secrets: inline secrets only apply without an env file
+    if env_file:
+        try:
+            with open(env_file) as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return {}
+    else:
+        lines = secrets or []
+    
+    groups = defaultdict(list)
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, sep, ref = line.partition("=")
+        if sep and ref.startswith("op://"):
+            groups[ref].append(key.strip())
+    
+    return {ref: keys for ref, keys in groups.items() if len(keys) > 1}
+
+
+@cache
+def _parser():
+    """Build the argument parser once; argparse is only imported when parsing."""
+    import argparse
+    
     # Custom argument parsing to handle -- separator
     parser = argparse.ArgumentParser(
         description="Run commands with 1Password secrets injected",
@@ -101,7 +151,11 @@ def main():
                         help="Inline secret reference (KEY=op://vault/item/field)")
     parser.add_argument("--no-masking", action="store_true", help="Disable secret masking")
     parser.add_argument("command", nargs=argparse.REMAINDER, help="Command to run")
-    
+    return parser
+
+
+def main():
+    parser = _parser()
     args = parser.parse_args()
     
     # Extract command (everything after --)
@@ -118,20 +172,19 @@ def main():
     
     # Validate env file exists
     if args.env_file and not os.path.exists(args.env_file):
-        print(json.dumps({"error": f"Env file not found: {args.env_file}"}), file=sys.stderr)
+        emit({"error": f"Env file not found: {args.env_file}"}, pretty=False, file=sys.stderr)
         sys.exit(1)
     
     # Validate secret references
     if args.secrets:
-        for secret in args.secrets:
-            if "=" not in secret:
-                print(json.dumps({"error": f"Invalid secret format: {secret}. Use KEY=op://vault/item/field"}), file=sys.stderr)
-                sys.exit(1)
-            
-            key, ref = secret.split("=", 1)
-            if not validate_secret_reference(ref):
-                print(json.dumps({"error": f"Invalid secret reference: {ref}. Use op://vault/item/field"}), file=sys.stderr)
-                sys.exit(1)
+        error = validate_secrets(args.secrets)
+        if error:
+            emit({"error": error}, pretty=False, file=sys.stderr)
+            sys.exit(1)
+    
+    # op run resolves every variable separately, so aliased references cost extra fetches
+    for ref, keys in find_duplicate_references(args.env_file, args.secrets).items():
+        emit({"warning": f"{', '.join(keys)} share {ref}; each is resolved separately"}, pretty=False, file=sys.stderr)
     
     # Run command with secrets
     exit_code, stdout, stderr = run_with_secrets(
@@ -142,7 +195,7 @@ def main():
     )
     
     if stderr:
-        print(json.dumps({"error": stderr}), file=sys.stderr)
+        emit({"error": stderr}, pretty=False, file=sys.stderr)
     
     sys.exit(exit_code)
 
@@ -20,31 +20,13 @@ Options:
     --tags <tags>         Update tags (comma-separated)
 """
 
-import subprocess
 import sys
-import json
-import argparse
+from functools import cache
 
-
-def run_op_command(args: list[str]) -> tuple[bool, str, str]:
-    """Run an op command and return success, stdout, stderr."""
-    try:
-        result = subprocess.run(
-            ["op"] + args,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-        return result.returncode == 0, result.stdout.strip(), result.stderr.strip()
-    except FileNotFoundError:
-        return False, "", "1Password CLI not found"
-    except subprocess.TimeoutExpired:
-        return False, "", "Command timed out"
-    except Exception as e:
-        return False, "", str(e)
+from op_common import emit, format_fields, loads, run_op_command
 
 
-def update_item(
+def build_update_args(
     vault: str = None,
     item: str = None,
     item_id: str = None,
@@ -55,57 +37,74 @@ def update_item(
     generate_password: bool = False,
     title: str = None,
     tags: str = None
-) -> tuple[bool, dict, str]:
-    """Update an existing item in 1Password."""
-    
-    args = ["item", "edit", "--format", "json"]
-    
+) -> tuple[list[str] | None, str]:
+    """Build the op item edit arguments, or return None and an error message."""
     # Identify item
     if item_id:
-        args.append(item_id)
+        target = [item_id]
     elif vault and item:
-        args.extend([item, "--vault", vault])
+        target = [item, "--vault", vault]
     else:
-        return False, {}, "Specify either --id or --vault and --item"
-    
-    # Generate password flag
-    if generate_password:
-        args.append("--generate-password")
-    
-    # Update title
-    if title:
-        args.extend(["--title", title])
-    
-    # Update tags
-    if tags:
-        args.extend(["--tags", tags])
+        return None, "Specify either --id or --vault and --item"
     
-    # Build field updates
-    field_updates = []
+    # Field-only edits are the common case; skip the per-option branches
+    if fields and not (username or password or url or generate_password or title or tags):
+        return _field_update_args(target, fields), ""
     
-    if username:
-        field_updates.append(f"username={username}")
-    
-    if password and not generate_password:
-        field_updates.append(f"password={password}")
-    
-    if url:
-        field_updates.append(f"url={url}")
-    
-    # Add custom fields
-    if fields:
-        for field in fields:
-            if "[" not in field and "=" in field:
-                key, value = field.split("=", 1)
-                field_updates.append(f"{key}[text]={value}")
-            else:
-                field_updates.append(field)
+    field_updates = [
+        *([f"username={username}"] if username else []),
+        *([f"password={password}"] if password and not generate_password else []),
+        *([f"url={url}"] if url else []),
+        *format_fields(fields or []),
+    ]
     
     # Must have something to update
     if not field_updates and not generate_password and not title and not tags:
-        return False, {}, "No updates specified"
-    
-    args.extend(field_updates)
+        return None, "No updates specified"
+    
+    args = [
+        "item", "edit", "--format", "json",
+        *target,
+        *(["--generate-password"] if generate_password else []),
+        *(["--title", title] if title else []),
+        *(["--tags", tags] if tags else []),
+        *field_updates,
+    ]
+    return args, ""
+
+
+def _field_update_args(target: list[str], fields: list[str]) -> list[str]:
+    """Build op item edit arguments for an update that only touches custom fields."""
+    return ["item", "edit", "--format", "json", *target, *format_fields(fields)]
+
+
+def update_item(
+    vault: str = None,
+    item: str = None,
+    item_id: str = None,
+    username: str = None,
+    password: str = None,
+    url: str = None,
+    fields: list[str] = None,
+    generate_password: bool = False,
+    title: str = None,
+    tags: str = None
+) -> tuple[bool, dict, str]:
+    """Update an existing item in 1Password."""
+    args, error = build_update_args(
+        vault=vault,
+        item=item,
+        item_id=item_id,
+        username=username,
+        password=password,
+        url=url,
+        fields=fields,
+        generate_password=generate_password,
+        title=title,
+        tags=tags
+    )
+    if args is None:
+        return False, {}, error
     
     success, output, error = run_op_command(args)
     
@@ -113,13 +112,17 @@ def update_item(
         return False, {}, error
     
     try:
-        item_data = json.loads(output) if output else {}
+        item_data = loads(output) if output and not output.isspace() else {}
         return True, item_data, ""
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         return False, {}, f"Failed to parse response: {e}"
 
 
-def main():
+@cache
+def _parser():
+    """Build the argument parser once; argparse is only imported when parsing."""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="Update 1Password items")
     parser.add_argument("--vault", type=str, help="Vault name or ID")
     parser.add_argument("--item", type=str, help="Item name or title")
@@ -131,7 +134,11 @@ def main():
     parser.add_argument("--generate", action="store_true", help="Generate new password")
     parser.add_argument("--title", type=str, help="Update item title")
     parser.add_argument("--tags", type=str, help="Update tags (comma-separated)")
-    
+    return parser
+
+
+def main():
+    parser = _parser()
     args = parser.parse_args()
     
     # Validate
@@ -152,7 +159,7 @@ def main():
     )
     
     if not success:
-        print(json.dumps({"error": error}), file=sys.stderr)
+        emit({"error": error}, pretty=False, file=sys.stderr)
         sys.exit(1)
     
     # Output updated item info (without secrets)
@@ -165,7 +172,7 @@ def main():
         "updated_at": item.get("updated_at")
     }
     
-    print(json.dumps(result, indent=2))
+    emit(result)
     sys.exit(0)
 
 
@@ -12,6 +12,9 @@ Usage:
     python repo_review_om.py --no-docs          # Exclude .md, .txt, etc from analysis
     python repo_review_om.py --since 2025-01-01
     python repo_review_om.py --chart            # Generate weekly dot plot
+    python repo_review_om.py --no-breakdown     # Summary tables only (faster on large repos)
+    python repo_review_om.py --no-cache         # Re-read every repo's git log
+    python repo_review_om.py --include-branches # Also count local branches
     python repo_review_om.py --output out.csv
 
 Examples:
@@ -22,14 +25,19 @@ Examples:
 import argparse
 import csv
 import fnmatch
+import hashlib
+import heapq
 import os
+import pickle
 import re
 import shutil
 import subprocess
 import sys
-import tempfile
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -71,6 +79,11 @@ class C:
     BOX = "\033[38;2;79;232;143m"        # #4fe88f - box borders
 
 
+# Same palette with every code blanked; main() swaps it in for C when
+# color is off
+_NO_COLOR = type("C", (), {name: "" for name in vars(C) if not name.startswith("_")})
+
+
 class Box:
     """Unicode box-drawing characters."""
     H = "─"      # Horizontal
@@ -94,6 +107,17 @@ CODE_DIR = Path("/home/ags/Code")
 DEFAULT_SINCE = "2025-01-01"
 ORG_NAME = "WTD-UP"
 
+# History to analyze: the checked-out branch plus origin's branches. Tags,
+# stashes, PR refs and local WIP branches are skipped (--include-branches
+# adds local branches back)
+LOG_REFS = ("HEAD", "--remotes=origin")
+BRANCH_REFS = (*LOG_REFS, "--branches")
+
+# Parsed git log results, keyed by repo, options and ref tips (--no-cache skips)
+LOG_CACHE_DIR = Path.home() / ".cache" / "cursor-skills" / "repo_review"
+LOG_CACHE_VERSION = 2
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
 # Global flag for excluding docs (set by --no-docs)
 EXCLUDE_DOCS = False
 DOC_EXTENSIONS = {".md", ".mdx", ".rst", ".txt"}
@@ -176,27 +200,33 @@ CATEGORY_LABELS = {
 }
 
 
+_TEST_FILE_RE = re.compile(r"\.test\.|\.spec\.|_test\.")
+
+
+@lru_cache(maxsize=32768)
 def get_file_category(filepath: str) -> str:
     """Determine work category from file extension."""
-    basename = os.path.basename(filepath).lower()
+    basename = filepath.rpartition("/")[2].lower()
     
     # Check for test files first (special patterns)
-    if ".test." in basename or ".spec." in basename or "_test." in basename:
+    if _TEST_FILE_RE.search(basename):
         return "testing"
     if basename == "dockerfile" or basename.startswith("dockerfile."):
         return "infra"
     
-    # Get extension
-    _, ext = os.path.splitext(filepath.lower())
-    return FILE_CATEGORIES.get(ext, "other")
+    # Extension as os.path.splitext finds it: leading dots don't count
+    stem = basename.lstrip(".")
+    dot = stem.rfind(".")
+    return FILE_CATEGORIES.get(stem[dot:], "other") if dot >= 0 else "other"
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TERMINAL UTILITIES
 # ═══════════════════════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=None)
 def get_term_width() -> int:
-    """Get terminal width, default to 100."""
+    """Get terminal width, default to 100; looked up once per run."""
     return shutil.get_terminal_size((100, 24)).columns
 
 
@@ -230,11 +260,15 @@ def run_cmd(cmd: list[str], cwd: str = None) -> tuple[int, str, str]:
 
 def discover_local_repos(base_dir: Path) -> list[dict]:
     repos = []
-    if not base_dir.exists():
+    try:
+        # scandir's entries know their type from the directory listing, so
+        # only the .git check costs a stat per subdirectory
+        with os.scandir(base_dir) as entries:
+            for entry in entries:
+                if entry.is_dir() and os.path.exists(os.path.join(entry.path, ".git")):
+                    repos.append({"name": entry.name, "path": base_dir / entry.name})
+    except (FileNotFoundError, NotADirectoryError):
         return repos
-    for item in base_dir.iterdir():
-        if item.is_dir() and (item / ".git").exists():
-            repos.append({"name": item.name, "path": item})
     return sorted(repos, key=lambda x: x["name"].lower())
 
 
@@ -259,35 +293,23 @@ def fetch_org_repos(base_dir: Path) -> list[dict]:
     skipped = []
     base_dir.mkdir(parents=True, exist_ok=True)
     
-    for repo_info in org_repos:
-        repo_name = repo_info["name"]
-        repo_path = base_dir / repo_name
-        
-        if repo_path.exists() and (repo_path / ".git").exists():
-            # Fetch latest
-            print(f"  {C.GRAY}├─{C.RESET} {C.WHITE}{repo_name}{C.RESET} {C.GRAY}(fetch){C.RESET}")
-            run_cmd(["git", "fetch", "--all"], cwd=str(repo_path))
-            repos.append({"name": repo_name, "path": repo_path})
-        else:
-            # Try HTTPS first (works with gh auth), then SSH
-            https_url = f"https://github.com/{ORG_NAME}/{repo_name}.git"
-            ssh_url = repo_info.get("sshUrl", "")
-            
-            print(f"  {C.TEAL}├─{C.RESET} {C.WHITE}{repo_name}{C.RESET} {C.TEAL}(clone){C.RESET}", end="", flush=True)
-            
-            # Try HTTPS first
-            rc, _, stderr = run_cmd(["git", "clone", "--quiet", https_url, str(repo_path)])
-            
-            if rc != 0 and ssh_url:
-                # Fallback to SSH
-                rc, _, stderr = run_cmd(["git", "clone", "--quiet", ssh_url, str(repo_path)])
+    # Fetches and clones are network-bound, so run them concurrently and
+    # report each repo in order as its result comes in
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = executor.map(lambda repo_info: sync_org_repo(repo_info, base_dir), org_repos)
+        for repo_info, (action, ok) in zip(org_repos, results):
+            repo_name = repo_info["name"]
+            repo_path = base_dir / repo_name
             
-            if rc != 0:
-                print(f" {C.RED}✗ skipped{C.RESET}")
+            if action == "fetch":
+                print(f"  {C.GRAY}├─{C.RESET} {C.WHITE}{repo_name}{C.RESET} {C.GRAY}(fetch){C.RESET}")
+            elif ok:
+                print(f"  {C.TEAL}├─{C.RESET} {C.WHITE}{repo_name}{C.RESET} {C.TEAL}(clone){C.RESET} {C.GREEN}✓{C.RESET}")
+            else:
+                print(f"  {C.TEAL}├─{C.RESET} {C.WHITE}{repo_name}{C.RESET} {C.TEAL}(clone){C.RESET} {C.RED}✗ skipped{C.RESET}")
                 skipped.append(repo_name)
                 continue
             
-            print(f" {C.GREEN}✓{C.RESET}")
             repos.append({"name": repo_name, "path": repo_path})
     
     if skipped:
@@ -296,6 +318,29 @@ def fetch_org_repos(base_dir: Path) -> list[dict]:
     return sorted(repos, key=lambda x: x["name"].lower())
 
 
+def sync_org_repo(repo_info: dict, base_dir: Path) -> tuple[str, bool]:
+    """Fetch an existing clone or clone a missing one; returns (action, ok)."""
+    repo_name = repo_info["name"]
+    repo_path = base_dir / repo_name
+    
+    if repo_path.exists() and (repo_path / ".git").exists():
+        # Fetch latest
+        run_cmd(["git", "fetch", "--all"], cwd=str(repo_path))
+        return "fetch", True
+    
+    # Try HTTPS first (works with gh auth), then SSH
+    https_url = f"https://github.com/{ORG_NAME}/{repo_name}.git"
+    ssh_url = repo_info.get("sshUrl", "")
+    
+    rc, _, _ = run_cmd(["git", "clone", "--quiet", https_url, str(repo_path)])
+    
+    if rc != 0 and ssh_url:
+        # Fallback to SSH
+        rc, _, _ = run_cmd(["git", "clone", "--quiet", ssh_url, str(repo_path)])
+    
+    return "clone", rc == 0
+
+
 def parse_repo_url(url: str) -> tuple[str, str, str]:
     """
     Parse a GitHub URL into (owner, repo_name, clone_url).
@@ -329,8 +374,10 @@ def clone_single_repo(url: str, temp_dir: Path) -> dict:
     
     print(f"{C.CYAN}Cloning {display_name}...{C.RESET}")
     
-    # Clone the repo
-    rc, _, stderr = run_cmd(["git", "clone", "--quiet", clone_url, str(repo_path)])
+    # Full clone: git log --numstat diffs every commit, which would make a
+    # blobless clone fetch blobs one commit at a time. The temp clone is
+    # never checked out, though
+    rc, _, stderr = run_cmd(["git", "clone", "--quiet", "--no-checkout", clone_url, str(repo_path)])
     
     if rc != 0:
         print(f"{C.RED}Failed to clone {display_name}: {stderr}{C.RESET}")
@@ -341,28 +388,33 @@ def clone_single_repo(url: str, temp_dir: Path) -> dict:
     return {"name": display_name, "path": repo_path}
 
 
+# EXCLUDE_PATTERNS folded into two regexes: a glob match against the whole
+# path or any suffix after a "/" (which also covers the basename), and a
+# substring match of each directory pattern's name anywhere in the path
+_EXCLUDE_GLOB_RE = re.compile("|".join(
+    fnmatch.translate(glob) for pattern in EXCLUDE_PATTERNS for glob in (pattern, f"*/{pattern}")
+))
+_EXCLUDE_DIR_RE = re.compile("|".join(
+    re.escape(dir_pattern) for dir_pattern in (
+        pattern.rstrip("/*").rstrip("*") for pattern in EXCLUDE_PATTERNS if "/" in pattern
+    ) if dir_pattern
+))
+
+
+@lru_cache(maxsize=65536)
+def _matches_exclude_pattern(filepath: str) -> bool:
+    return bool(_EXCLUDE_GLOB_RE.match(filepath) or _EXCLUDE_DIR_RE.search(filepath.lower()))
+
+
 def should_exclude_file(filepath: str) -> bool:
-    basename = os.path.basename(filepath)
-    filepath_lower = filepath.lower()
-    
     # Check --no-docs flag
     if EXCLUDE_DOCS:
-        _, ext = os.path.splitext(filepath_lower)
+        _, ext = os.path.splitext(filepath.lower())
         if ext in DOC_EXTENSIONS:
             return True
     
-    for pattern in EXCLUDE_PATTERNS:
-        if fnmatch.fnmatch(filepath, pattern):
-            return True
-        if fnmatch.fnmatch(filepath, f"*/{pattern}"):
-            return True
-        if fnmatch.fnmatch(basename, pattern):
-            return True
-        if "/" in pattern:
-            dir_pattern = pattern.rstrip("/*").rstrip("*")
-            if dir_pattern and dir_pattern in filepath_lower:
-                return True
-    return False
+    # git logs repeat the same paths across commits, so results are cached
+    return _matches_exclude_pattern(filepath)
 
 
 def should_exclude_author(author: str) -> bool:
@@ -370,121 +422,438 @@ def should_exclude_author(author: str) -> bool:
     return any(ex.lower() in author_lower for ex in EXCLUDE_AUTHORS)
 
 
-def get_git_log(repo_path: Path, since: str, until: str = None) -> str:
-    cmd = ["git", "log", "--numstat", "--format=COMMIT|%H|%an|%ad", "--date=short", f"--since={since}", "--all"]
+# Whether this git supports --perl-regexp (needs a PCRE build); probed once
+_GIT_PERL_REGEXP = None
+
+
+def exclude_author_args(repo_path: Path) -> list[str]:
+    """Express EXCLUDE_AUTHORS as a git log author filter, mirroring should_exclude_author.
+    
+    --author only selects, so a negative lookahead over the name (the ident
+    up to "<email>") drops excluded authors' commits before git diffs them.
+    Returns no args if git lacks PCRE; the parsers still filter authors.
+    """
+    global _GIT_PERL_REGEXP
+    if not EXCLUDE_AUTHORS:
+        return []
+    names = "|".join(re.escape(author) for author in EXCLUDE_AUTHORS)
+    args = ["--regexp-ignore-case", "--perl-regexp", f"--author=^(?![^<]*(?:{names}))"]
+    if _GIT_PERL_REGEXP is None:
+        rc, _, _ = run_cmd(["git", "log", "-n0", "--all", *args], cwd=str(repo_path))
+        _GIT_PERL_REGEXP = rc == 0
+    return args if _GIT_PERL_REGEXP else []
+
+
+def exclude_pathspecs() -> list[str]:
+    """Express EXCLUDE_PATTERNS (and --no-docs) as git pathspecs, mirroring should_exclude_file.
+    
+    Non-glob pathspecs match like fnmatch without FNM_PATHNAME, so git drops
+    the same files before emitting any stats for them.
+    """
+    specs = []
+    for pattern in EXCLUDE_PATTERNS:
+        specs += [f":(exclude){pattern}", f":(exclude)*/{pattern}"]
+        if "/" in pattern:
+            dir_pattern = pattern.rstrip("/*").rstrip("*")
+            if dir_pattern:
+                specs.append(f":(exclude,icase)*{dir_pattern}*")
+    if EXCLUDE_DOCS:
+        specs += [f":(exclude,icase)*{ext}" for ext in DOC_EXTENSIONS]
+    return specs
+
+
+def stream_git_log(
+    repo_path: Path, since: str, until: str = None, per_file: bool = True, revs: list[str] = None
+):
+    """Yield NUL-delimited `git log` fields as bytes while git runs.
+    
+    With per_file, fields are `-z --numstat` rows; otherwise each commit is one
+    field holding its header and `--shortstat` line. Either way excluded
+    paths and authors are filtered out by git itself. revs defaults to LOG_REFS.
+    
+    Once drained, raises CalledProcessError if git exited non-zero: its
+    output was cut short and must not be taken for the full history.
+    """
+    if per_file:
+        cmd = ["git", "log", "-z", "--numstat", "--format=COMMIT%x1f%H%x1f%an%x1f%ad"]
+    else:
+        cmd = ["git", "log", "--shortstat", "--format=%x00COMMIT%x1f%H%x1f%an%x1f%ad"]
+    cmd += ["--date=short", f"--since={since}", *(revs or LOG_REFS)]
     if until:
         cmd.append(f"--until={until}")
-    rc, stdout, _ = run_cmd(cmd, cwd=str(repo_path))
-    return stdout if rc == 0 else ""
+    cmd += exclude_author_args(repo_path)
+    # Merges carry no diff stats of their own; --full-history keeps pathspec
+    # history simplification from pruning side branches
+    cmd += ["--no-merges", "--full-history", "--", *exclude_pathspecs()]
+    try:
+        proc = subprocess.Popen(cmd, cwd=str(repo_path), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except OSError:
+        return
+    
+    pending = b""
+    drained = False
+    try:
+        for chunk in iter(lambda: proc.stdout.read(65536), b""):
+            fields = (pending + chunk).split(b"\0")
+            pending = fields.pop()
+            yield from fields
+        if pending:
+            yield pending
+        drained = True
+    finally:
+        proc.stdout.close()
+        # Only a consumer that stopped early leaves git still writing
+        if not drained:
+            proc.kill()
+        proc.wait()
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+@lru_cache(maxsize=None)
+def week_start(date: bytes) -> datetime | None:
+    """Monday of the week containing a YYYY-MM-DD commit date, parsed once per distinct day."""
+    # Slicing the fixed-width --date=short format skips strptime's format parsing
+    try:
+        day = datetime(int(date[0:4]), int(date[5:7]), int(date[8:10]))
+    except ValueError:
+        return None
+    return day - timedelta(days=day.weekday())
 
 
-def parse_git_log(log_output: str) -> dict:
-    stats = defaultdict(lambda: {
-        "commits": set(), "inserts": 0, "deletes": 0,
-        "weekly": defaultdict(lambda: {"inserts": 0, "deletes": 0, "commits": set()}),
-        "by_ext": defaultdict(lambda: {"inserts": 0, "deletes": 0}),
-        "by_category": defaultdict(lambda: {"inserts": 0, "deletes": 0}),
-    })
-    current_author = None
-    current_commit = None
-    current_date = None
+def nest_stats(commits: dict, totals: dict, weekly: dict, by_ext: dict, by_category: dict) -> dict:
+    """Build per-author nested stats from flat counters keyed by author or (author, key).
+    
+    "commits" values are counts: git log lists each commit once, so nothing
+    needs de-duplicating.
+    """
+    stats = {
+        author: {
+            "commits": commits[author], "inserts": ins, "deletes": dels,
+            "weekly": {}, "by_ext": {}, "by_category": {},
+        }
+        for author, (ins, dels) in totals.items()
+    }
+    for (author, week), (ins, dels, week_commits) in weekly.items():
+        stats[author]["weekly"][week] = {"inserts": ins, "deletes": dels, "commits": week_commits}
+    for key, counts in (("by_ext", by_ext), ("by_category", by_category)):
+        for (author, name), (ins, dels) in counts.items():
+            stats[author][key][name] = {"inserts": ins, "deletes": dels}
+    return stats
+
 
-    for line in log_output.strip().split("\n"):
-        if not line:
+def parse_git_log(fields) -> dict:
+    # Flat counters keyed by author or (author, key), holding [inserts, deletes];
+    # nested per-author dicts are only built once at the end
+    commits = {}
+    totals = {}
+    weekly = {}
+    by_ext = {}
+    by_category = {}
+    current_author = None
+    current_week = None
+    # Set on each header; a commit counts once, on its first counted row
+    new_commit = False
+    # Raw path -> (extension, category), or None if excluded; logs repeat the
+    # same paths, so each one is decoded and classified once
+    path_info = {}
+    fields = iter(fields)
+
+    for field in fields:
+        # Numstat rows far outnumber headers, so try them first; the path is
+        # everything after the second tab (it may contain tabs itself)
+        parts = field.split(b"\t", 2)
+        if len(parts) != 3:
+            # Each commit header ends in NUL and is followed by a newline
+            field = field.lstrip(b"\n")
+            if field.startswith(b"COMMIT\x1f"):
+                # Unit separators can't occur in names, unlike "|"
+                parts = field.split(b"\x1f")
+                if len(parts) == 4:
+                    new_commit = True
+                    author_name = parts[2].decode("utf-8", "replace").strip()
+                    if should_exclude_author(author_name):
+                        current_author = None
+                        continue
+                    current_author = author_name
+                    current_week = week_start(parts[3])
             continue
-        if line.startswith("COMMIT|"):
-            parts = line.split("|")
-            if len(parts) >= 4:
-                current_commit = parts[1]
-                author_name = parts[2].strip()
-                if should_exclude_author(author_name):
-                    current_author = None
-                    continue
-                current_author = author_name
-                try:
-                    current_date = datetime.strptime(parts[3], "%Y-%m-%d")
-                except ValueError:
-                    current_date = None
+        insertions, deletions, filepath = parts
+        if not filepath:
+            # Renames/copies: "ins\tdel\t" NUL old-path NUL new-path
+            next(fields, None)
+            filepath = next(fields, b"")
+        # Binary files report "-" for both counts
+        if not current_author or deletions == b"-":
             continue
-        parts = line.split("\t")
-        if len(parts) == 3 and current_author:
-            insertions, deletions, filepath = parts
-            if insertions == "-" or deletions == "-":
-                continue
-            if should_exclude_file(filepath):
-                continue
-            try:
-                ins, dels = int(insertions), int(deletions)
-                stats[current_author]["commits"].add(current_commit)
-                stats[current_author]["inserts"] += ins
-                stats[current_author]["deletes"] += dels
-                
-                # Track by file extension
-                _, ext = os.path.splitext(filepath.lower())
-                if ext:
-                    stats[current_author]["by_ext"][ext]["inserts"] += ins
-                    stats[current_author]["by_ext"][ext]["deletes"] += dels
-                
-                # Track by work category
-                category = get_file_category(filepath)
-                stats[current_author]["by_category"][category]["inserts"] += ins
-                stats[current_author]["by_category"][category]["deletes"] += dels
-                
-                if current_date:
-                    week_start = current_date - timedelta(days=current_date.weekday())
-                    stats[current_author]["weekly"][week_start]["inserts"] += ins
-                    stats[current_author]["weekly"][week_start]["deletes"] += dels
-                    stats[current_author]["weekly"][week_start]["commits"].add(current_commit)
-            except ValueError:
-                continue
-    return stats
+        info = path_info.get(filepath, False)
+        if info is False:
+            path = filepath.decode("utf-8", "replace")
+            # Safety net; git's exclude pathspecs should already have dropped these
+            if should_exclude_file(path):
+                info = None
+            else:
+                info = os.path.splitext(path.lower())[1], get_file_category(path)
+            path_info[filepath] = info
+        if info is None:
+            continue
+        ext, category = info
+        try:
+            # int() skips the newline that leads the first row after a header
+            ins, dels = int(insertions), int(deletions)
+        except ValueError:
+            continue
+        
+        counts = totals.get(current_author)
+        if counts is None:
+            totals[current_author] = [ins, dels]
+            commits[current_author] = 1
+        else:
+            counts[0] += ins
+            counts[1] += dels
+            commits[current_author] += new_commit
+        
+        # Track by file extension
+        if ext:
+            counts = by_ext.get((current_author, ext))
+            if counts is None:
+                by_ext[(current_author, ext)] = [ins, dels]
+            else:
+                counts[0] += ins
+                counts[1] += dels
+        
+        # Track by work category
+        counts = by_category.get((current_author, category))
+        if counts is None:
+            by_category[(current_author, category)] = [ins, dels]
+        else:
+            counts[0] += ins
+            counts[1] += dels
+        
+        if current_week:
+            counts = weekly.get((current_author, current_week))
+            if counts is None:
+                weekly[(current_author, current_week)] = [ins, dels, 1]
+            else:
+                counts[0] += ins
+                counts[1] += dels
+                counts[2] += new_commit
+        new_commit = False
+    return nest_stats(commits, totals, weekly, by_ext, by_category)
+
+
+_SHORTSTAT_INSERTS_RE = re.compile(rb"(\d+) insertion")
+_SHORTSTAT_DELETES_RE = re.compile(rb"(\d+) deletion")
+
+
+def parse_git_shortstat(fields) -> dict:
+    """Author totals from `--shortstat` fields; by_ext/by_category stay empty."""
+    commits = {}
+    totals = {}
+    weekly = {}
+
+    for field in fields:
+        header, _, shortstat = field.partition(b"\n")
+        parts = header.split(b"\x1f")
+        # Merges have no diff and so no shortstat line
+        if len(parts) != 4 or not parts[0].endswith(b"COMMIT") or b"changed" not in shortstat:
+            continue
+        author_name = parts[2].decode("utf-8", "replace").strip()
+        if should_exclude_author(author_name):
+            continue
+        
+        match = _SHORTSTAT_INSERTS_RE.search(shortstat)
+        ins = int(match[1]) if match else 0
+        match = _SHORTSTAT_DELETES_RE.search(shortstat)
+        dels = int(match[1]) if match else 0
+        
+        counts = totals.get(author_name)
+        if counts is None:
+            totals[author_name] = [ins, dels]
+            commits[author_name] = 1
+        else:
+            counts[0] += ins
+            counts[1] += dels
+            commits[author_name] += 1
+        
+        week = week_start(parts[3])
+        if week:
+            counts = weekly.get((author_name, week))
+            if counts is None:
+                weekly[(author_name, week)] = [ins, dels, 1]
+            else:
+                counts[0] += ins
+                counts[1] += dels
+                counts[2] += 1
+    return nest_stats(commits, totals, weekly, {}, {})
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ANALYSIS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def analyze_repos(repos: list[dict], since: str, until: str = None) -> tuple[list[dict], dict, dict, dict]:
-    all_data = []
-    weekly_stats = defaultdict(lambda: defaultdict(lambda: {"inserts": 0, "deletes": 0, "commits": set()}))
-    ext_stats = defaultdict(lambda: defaultdict(lambda: {"inserts": 0, "deletes": 0}))
-    category_stats = defaultdict(lambda: defaultdict(lambda: {"inserts": 0, "deletes": 0}))
-    total = len(repos)
+def _init_worker(exclude_docs: bool):
+    """Carry --no-docs into worker processes (spawned workers don't inherit it)."""
+    global EXCLUDE_DOCS
+    EXCLUDE_DOCS = exclude_docs
 
-    for i, repo in enumerate(repos, 1):
-        repo_name = repo["name"]
-        bar = progress_bar(i, total, 15)
-        print(f"  {C.GRAY}{Box.V}{C.RESET} {bar} {C.CYAN}{repo_name:<30}{C.RESET}", end="\r")
 
-        log_output = get_git_log(repo["path"], since, until)
-        if not log_output:
+def ref_tips(repo_path: Path, refs: tuple[str, ...] = LOG_REFS) -> list[str] | None:
+    """Commit ids the analyzed refs point at; the log cache is valid while these match."""
+    rc, stdout, _ = run_cmd(["git", "rev-parse", *refs], cwd=str(repo_path))
+    return sorted(set(stdout.split())) if rc == 0 else None
+
+
+def _log_cache_path(repo_path: Path, since: str, until: str, per_file: bool, refs: tuple[str, ...]) -> Path:
+    """Cache file for one repo and one set of analysis options."""
+    key = [LOG_CACHE_VERSION, str(Path(repo_path).resolve()), since, until, per_file, refs,
+           EXCLUDE_DOCS, EXCLUDE_PATTERNS, EXCLUDE_AUTHORS]
+    # Relative dates ("3 months ago") move daily, so scope them to today
+    if not all(_ISO_DATE_RE.fullmatch(date) for date in (since, until) if date):
+        key.append(datetime.now().strftime("%Y-%m-%d"))
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+    return LOG_CACHE_DIR / f"{digest}.pickle"
+
+
+def load_log_cache(cache_path: Path) -> dict | None:
+    try:
+        return pickle.loads(cache_path.read_bytes())
+    except Exception:
+        return None
+
+
+def save_log_cache(cache_path: Path, tips: list[str], stats: dict) -> None:
+    """Write the parsed stats atomically, so parallel workers never see partial files."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(pickle.dumps({"tips": tips, "stats": stats}, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def history_contains(repo_path: Path, old_tips: list[str], tips: list[str]) -> bool:
+    """True if every commit reachable from old_tips is still reachable from tips."""
+    rc, stdout, _ = run_cmd(["git", "rev-list", "--count", *old_tips, "--not", *tips], cwd=str(repo_path))
+    return rc == 0 and stdout.strip() == "0"
+
+
+def merge_repo_stats(stats: dict, new_stats: dict) -> dict:
+    """Fold stats for commits not yet seen into previously cached stats."""
+    for author, data in new_stats.items():
+        if author not in stats:
+            stats[author] = data
             continue
+        totals = stats[author]
+        totals["commits"] += data["commits"]
+        totals["inserts"] += data["inserts"]
+        totals["deletes"] += data["deletes"]
+        for week, week_data in data["weekly"].items():
+            week_totals = totals["weekly"].setdefault(week, {"inserts": 0, "deletes": 0, "commits": 0})
+            week_totals["inserts"] += week_data["inserts"]
+            week_totals["deletes"] += week_data["deletes"]
+            week_totals["commits"] += week_data["commits"]
+        for key in ("by_ext", "by_category"):
+            for name, counts in data[key].items():
+                name_totals = totals[key].setdefault(name, {"inserts": 0, "deletes": 0})
+                name_totals["inserts"] += counts["inserts"]
+                name_totals["deletes"] += counts["deletes"]
+    return stats
 
-        stats = parse_git_log(log_output)
-        for author, data in stats.items():
-            if data["inserts"] > 0 or data["deletes"] > 0:
-                all_data.append({
-                    "author": author, "repo": repo_name,
-                    "commits": len(data["commits"]),
-                    "inserts": data["inserts"], "deletes": data["deletes"],
-                    "net": data["inserts"] - data["deletes"]
-                })
-                for week, week_data in data["weekly"].items():
-                    weekly_stats[author][week]["inserts"] += week_data["inserts"]
-                    weekly_stats[author][week]["deletes"] += week_data["deletes"]
-                    weekly_stats[author][week]["commits"].update(week_data["commits"])
-                
-                # Aggregate extension stats
-                for ext, ext_data in data["by_ext"].items():
-                    ext_stats[author][ext]["inserts"] += ext_data["inserts"]
-                    ext_stats[author][ext]["deletes"] += ext_data["deletes"]
-                
-                # Aggregate category stats
-                for cat, cat_data in data["by_category"].items():
-                    category_stats[author][cat]["inserts"] += cat_data["inserts"]
-                    category_stats[author][cat]["deletes"] += cat_data["deletes"]
 
+def _process_repo(
+    repo: dict, since: str, until: str = None, per_file: bool = True, use_cache: bool = True,
+    refs: tuple[str, ...] = LOG_REFS
+) -> dict:
+    """Parse one repo's log into per-author stats.
+    
+    Results are cached per repo and options. An unchanged set of ref tips
+    skips git log entirely; new commits on top of the cached tips are read
+    incrementally and merged in.
+    """
+    tips = ref_tips(repo["path"], refs) if use_cache else None
+    cache_path = _log_cache_path(repo["path"], since, until, per_file, refs)
+    cached = load_log_cache(cache_path) if tips else None
+    if cached and cached["tips"] == tips:
+        return cached["stats"]
+    
+    # Log exactly the tips the cache will be keyed by, in case refs move meanwhile
+    revs = tips or refs
+    base_stats = {}
+    if cached and history_contains(repo["path"], cached["tips"], tips):
+        revs = [*tips, *(f"^{tip}" for tip in cached["tips"])]
+        base_stats = cached["stats"]
+    
+    fields = stream_git_log(repo["path"], since, until, per_file, revs)
+    try:
+        stats = parse_git_log(fields) if per_file else parse_git_shortstat(fields)
+    except subprocess.CalledProcessError:
+        # git failed partway: nothing is merged or cached from its truncated
+        # history, and the last complete result (if any) stands in
+        return cached["stats"] if cached else {}
+    stats = merge_repo_stats(base_stats, stats)
+    
+    if tips:
+        save_log_cache(cache_path, tips, stats)
+    return stats
+
+
+def analyze_repos(
+    repos: list[dict], since: str, until: str = None, per_file: bool = True, use_cache: bool = True,
+    refs: tuple[str, ...] = LOG_REFS
+) -> tuple[list[dict], dict, dict, dict]:
+    all_data = []
+    # Per-author stats summed across repos; each repo's stats are folded in
+    # (and consumed) by merge_repo_stats
+    author_stats = {}
+    total = len(repos)
+    workers = min(os.cpu_count() or 1, total)
+
+    # Each repo is one git process plus pure-Python parsing, so repos run in
+    # parallel processes; aggregation stays here in input order
+    if workers > 1:
+        # multiprocessing (and the tempfile it loads) is only imported on
+        # this path, keeping --repo and early-exit runs light
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(EXCLUDE_DOCS,))
+        results = executor.map(
+            _process_repo, repos, [since] * total, [until] * total, [per_file] * total, [use_cache] * total,
+            [refs] * total
+        )
+    else:
+        executor = None
+        results = (_process_repo(repo, since, until, per_file, use_cache, refs) for repo in repos)
+
+    # Redraw the progress line only when the bar gains a cell
+    bar_width = 15
+    last_filled = -1
+
+    for i, (repo, stats) in enumerate(zip(repos, results), 1):
+        repo_name = repo["name"]
+        filled = int(bar_width * min(i / total, 1.0))
+        if filled != last_filled:
+            last_filled = filled
+            bar = progress_bar(i, total, bar_width)
+            sys.stdout.write(f"  {C.GRAY}{Box.V}{C.RESET} {bar} {C.CYAN}{repo_name:<30}{C.RESET}\r")
+            sys.stdout.flush()
+
+        active = {author: data for author, data in stats.items() if data["inserts"] > 0 or data["deletes"] > 0}
+        for author, data in active.items():
+            all_data.append({
+                "author": author, "repo": repo_name,
+                "commits": data["commits"],
+                "inserts": data["inserts"], "deletes": data["deletes"],
+                "net": data["inserts"] - data["deletes"]
+            })
+        merge_repo_stats(author_stats, active)
+
+    if executor:
+        executor.shutdown()
     print(" " * 60)  # Clear progress line
+    weekly_stats = {author: data["weekly"] for author, data in author_stats.items() if data["weekly"]}
+    ext_stats = {author: data["by_ext"] for author, data in author_stats.items() if data["by_ext"]}
+    category_stats = {author: data["by_category"] for author, data in author_stats.items() if data["by_category"]}
     return all_data, weekly_stats, ext_stats, category_stats
 
 
@@ -492,13 +861,20 @@ def analyze_repos(repos: list[dict], since: str, until: str = None) -> tuple[lis
 # OMARCHY-STYLED OUTPUT
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def print_header(title: str, width: int = None):
-    """Print a styled section header."""
+def write_lines(lines: list[str]):
+    """Write a rendered section to stdout in one call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def format_header(title: str, width: int = None) -> list[str]:
+    """Render a styled section header."""
     w = width or get_term_width()
     inner = w - 4
-    print(f"\n{C.BOX}{Box.TL}{Box.H * inner}{Box.TR}{C.RESET}")
-    print(f"{C.BOX}{Box.V}{C.RESET} {C.CYAN}{C.BOLD}{title:<{inner-1}}{C.RESET}{C.BOX}{Box.V}{C.RESET}")
-    print(f"{C.BOX}{Box.BL}{Box.H * inner}{Box.BR}{C.RESET}")
+    return [
+        f"\n{C.BOX}{Box.TL}{Box.H * inner}{Box.TR}{C.RESET}",
+        f"{C.BOX}{Box.V}{C.RESET} {C.CYAN}{C.BOLD}{title:<{inner-1}}{C.RESET}{C.BOX}{Box.V}{C.RESET}",
+        f"{C.BOX}{Box.BL}{Box.H * inner}{Box.BR}{C.RESET}",
+    ]
 
 
 def print_repo_table(data: list[dict]):
@@ -519,17 +895,26 @@ def print_repo_table(data: list[dict]):
     aw = max(20, max(len(d["author"]) for d in data) + 2)
     rw = max(25, max(len(d["repo"]) for d in data) + 2)
     
-    print_header("repo contributions")
+    # Rendered into one buffer and written once; V is the colored column rule
+    V = f"{C.BOX}{Box.V}{C.RESET}"
+    lines = format_header("repo contributions")
     
     # Header row
-    print(f"{C.BOX}{Box.TL}{Box.H * aw}{Box.TT}{Box.H * rw}{Box.TT}{Box.H * 10}{Box.TT}{Box.H * 12}{Box.TT}{Box.H * 12}{Box.TT}{Box.H * 12}{Box.TR}{C.RESET}")
-    print(f"{C.BOX}{Box.V}{C.RESET}{C.CYAN}{'Author':<{aw}}{C.RESET}{C.BOX}{Box.V}{C.RESET}{C.CYAN}{'Repository':<{rw}}{C.RESET}{C.BOX}{Box.V}{C.RESET}{C.CYAN}{'Commits':>10}{C.RESET}{C.BOX}{Box.V}{C.RESET}{C.GREEN}{'Inserts':>12}{C.RESET}{C.BOX}{Box.V}{C.RESET}{C.RED}{'Deletes':>12}{C.RESET}{C.BOX}{Box.V}{C.RESET}{C.BLUE}{'Net':>12}{C.RESET}{C.BOX}{Box.V}{C.RESET}")
-    print(f"{C.BOX}{Box.LT}{Box.H * aw}{Box.X}{Box.H * rw}{Box.X}{Box.H * 10}{Box.X}{Box.H * 12}{Box.X}{Box.H * 12}{Box.X}{Box.H * 12}{Box.RT}{C.RESET}")
-
+    lines.append(f"{C.BOX}{Box.TL}{Box.H * aw}{Box.TT}{Box.H * rw}{Box.TT}{Box.H * 10}{Box.TT}{Box.H * 12}{Box.TT}{Box.H * 12}{Box.TT}{Box.H * 12}{Box.TR}{C.RESET}")
+    lines.append(f"{V}{C.CYAN}{'Author':<{aw}}{C.RESET}{V}{C.CYAN}{'Repository':<{rw}}{C.RESET}{V}{C.CYAN}{'Commits':>10}{C.RESET}{V}{C.GREEN}{'Inserts':>12}{C.RESET}{V}{C.RED}{'Deletes':>12}{C.RESET}{V}{C.BLUE}{'Net':>12}{C.RESET}{V}")
+    lines.append(f"{C.BOX}{Box.LT}{Box.H * aw}{Box.X}{Box.H * rw}{Box.X}{Box.H * 10}{Box.X}{Box.H * 12}{Box.X}{Box.H * 12}{Box.X}{Box.H * 12}{Box.RT}{C.RESET}")
+
+    # Colors and column widths are baked into one format template per table
+    row_template = (
+        f"{V}{C.MAGENTA}{{author:<{aw}}}{C.RESET}{V}{C.WHITE}{{repo:<{rw}}}{C.RESET}"
+        f"{V}{C.WHITE}{{commits:>10,}}{C.RESET}{V}{C.GREEN}{{inserts:>12,}}{C.RESET}"
+        f"{V}{C.RED}{{deletes:>12,}}{C.RESET}{V}{C.BLUE}{{net:>12,}}{C.RESET}{V}"
+    )
     for row in data[:20]:  # Top 20
-        print(f"{C.BOX}{Box.V}{C.RESET}{C.MAGENTA}{row['author']:<{aw}}{C.RESET}{C.BOX}{Box.V}{C.RESET}{C.WHITE}{row['repo']:<{rw}}{C.RESET}{C.BOX}{Box.V}{C.RESET}{C.WHITE}{row['commits']:>10,}{C.RESET}{C.BOX}{Box.V}{C.RESET}{C.GREEN}{row['inserts']:>12,}{C.RESET}{C.BOX}{Box.V}{C.RESET}{C.RED}{row['deletes']:>12,}{C.RESET}{C.BOX}{Box.V}{C.RESET}{C.BLUE}{row['net']:>12,}{C.RESET}{C.BOX}{Box.V}{C.RESET}")
+        lines.append(row_template.format_map(row))
 
-    print(f"{C.BOX}{Box.BL}{Box.H * aw}{Box.BT}{Box.H * rw}{Box.BT}{Box.H * 10}{Box.BT}{Box.H * 12}{Box.BT}{Box.H * 12}{Box.BT}{Box.H * 12}{Box.BR}{C.RESET}")
+    lines.append(f"{C.BOX}{Box.BL}{Box.H * aw}{Box.BT}{Box.H * rw}{Box.BT}{Box.H * 10}{Box.BT}{Box.H * 12}{Box.BT}{Box.H * 12}{Box.BT}{Box.H * 12}{Box.BR}{C.RESET}")
+    write_lines(lines)
 
 
 def print_author_summary(data: list[dict]):
@@ -555,13 +940,19 @@ def print_author_summary(data: list[dict]):
     sorted_authors = sorted(author_totals.items(), key=lambda x: x[1]["net"], reverse=True)
     max_net = max(abs(a[1]["net"]) for a in sorted_authors) if sorted_authors else 1
 
-    print_header("author summary")
+    V = f"{C.BOX}{Box.V}{C.RESET}"
+    lines = format_header("author summary")
     
     aw = max(20, max(len(a[0]) for a in sorted_authors) + 2)
     
-    print(f"{C.BOX}{Box.TL}{Box.H * aw}{Box.TT}{Box.H * 6}{Box.TT}{Box.H * 10}{Box.TT}{Box.H * 22}{Box.TT}{Box.H * 12}{Box.TR}{C.RESET}")
-    print(f"{C.BOX}{Box.V}{C.RESET}{C.CYAN}{'Author':<{aw}}{C.RESET}{C.BOX}{Box.V}{C.RESET}{C.CYAN}{'Repos':>6}{C.RESET}{C.BOX}{Box.V}{C.RESET}{C.CYAN}{'Commits':>10}{C.RESET}{C.BOX}{Box.V}{C.RESET}{C.CYAN}{'Contribution':^22}{C.RESET}{C.BOX}{Box.V}{C.RESET}{C.BLUE}{'Net LoC':>12}{C.RESET}{C.BOX}{Box.V}{C.RESET}")
-    print(f"{C.BOX}{Box.LT}{Box.H * aw}{Box.X}{Box.H * 6}{Box.X}{Box.H * 10}{Box.X}{Box.H * 22}{Box.X}{Box.H * 12}{Box.RT}{C.RESET}")
+    lines.append(f"{C.BOX}{Box.TL}{Box.H * aw}{Box.TT}{Box.H * 6}{Box.TT}{Box.H * 10}{Box.TT}{Box.H * 22}{Box.TT}{Box.H * 12}{Box.TR}{C.RESET}")
+    lines.append(f"{V}{C.CYAN}{'Author':<{aw}}{C.RESET}{V}{C.CYAN}{'Repos':>6}{C.RESET}{V}{C.CYAN}{'Commits':>10}{C.RESET}{V}{C.CYAN}{'Contribution':^22}{C.RESET}{V}{C.BLUE}{'Net LoC':>12}{C.RESET}{V}")
+    lines.append(f"{C.BOX}{Box.LT}{Box.H * aw}{Box.X}{Box.H * 6}{Box.X}{Box.H * 10}{Box.X}{Box.H * 22}{Box.X}{Box.H * 12}{Box.RT}{C.RESET}")
+
+    row_template = (
+        f"{V}{C.MAGENTA}{{author:<{aw}}}{C.RESET}{V}{C.WHITE}{{repos:>6}}{C.RESET}"
+        f"{V}{C.WHITE}{{commits:>10,}}{C.RESET}{V} {{bar}} {V}{C.BLUE}{{net:>12,}}{C.RESET}{V}"
+    )
 
     for author, totals in sorted_authors:
         # Create visual bar with gradient
@@ -573,9 +964,11 @@ def print_author_summary(data: list[dict]):
             fill = int((abs(totals["net"]) / max_net) * bar_width) if max_net > 0 else 0
             bar = f"{C.GRAY}{'░' * (bar_width - fill)}{C.RED}{'█' * fill}{C.RESET}"
         
-        print(f"{C.BOX}{Box.V}{C.RESET}{C.MAGENTA}{author:<{aw}}{C.RESET}{C.BOX}{Box.V}{C.RESET}{C.WHITE}{len(totals['repos']):>6}{C.RESET}{C.BOX}{Box.V}{C.RESET}{C.WHITE}{totals['commits']:>10,}{C.RESET}{C.BOX}{Box.V}{C.RESET} {bar} {C.BOX}{Box.V}{C.RESET}{C.BLUE}{totals['net']:>12,}{C.RESET}{C.BOX}{Box.V}{C.RESET}")
+        lines.append(row_template.format(
+            author=author, repos=len(totals["repos"]), commits=totals["commits"], bar=bar, net=totals["net"]
+        ))
 
-    print(f"{C.BOX}{Box.BL}{Box.H * aw}{Box.BT}{Box.H * 6}{Box.BT}{Box.H * 10}{Box.BT}{Box.H * 22}{Box.BT}{Box.H * 12}{Box.BR}{C.RESET}")
+    lines.append(f"{C.BOX}{Box.BL}{Box.H * aw}{Box.BT}{Box.H * 6}{Box.BT}{Box.H * 10}{Box.BT}{Box.H * 22}{Box.BT}{Box.H * 12}{Box.BR}{C.RESET}")
 
     # Totals
     total_commits = sum(d["commits"] for d in data)
@@ -583,16 +976,18 @@ def print_author_summary(data: list[dict]):
     total_deletes = sum(d["deletes"] for d in data)
     total_net = sum(d["net"] for d in data)
 
-    print(f"\n{C.GRAY}{'─' * 60}{C.RESET}")
-    print(f"  {C.CYAN}Total:{C.RESET} {C.WHITE}{total_commits:,}{C.RESET} commits  {C.GREEN}+{total_inserts:,}{C.RESET}  {C.RED}-{total_deletes:,}{C.RESET}  {C.BLUE}= {total_net:,} net{C.RESET}")
-    print(f"{C.GRAY}{'─' * 60}{C.RESET}")
+    lines.append(f"\n{C.GRAY}{'─' * 60}{C.RESET}")
+    lines.append(f"  {C.CYAN}Total:{C.RESET} {C.WHITE}{total_commits:,}{C.RESET} commits  {C.GREEN}+{total_inserts:,}{C.RESET}  {C.RED}-{total_deletes:,}{C.RESET}  {C.BLUE}= {total_net:,} net{C.RESET}")
+    lines.append(f"{C.GRAY}{'─' * 60}{C.RESET}")
+    write_lines(lines)
 
 
-def gradient_bar(pct: float, width: int = 20, style: str = "cyan") -> str:
-    """Create a gradient progress bar like btop disk usage."""
-    filled = int(width * min(pct / 100, 1.0))
-    empty = width - filled
+@lru_cache(maxsize=None)
+def _gradient_bars(width: int, style: str) -> tuple[str, ...]:
+    """Every gradient bar of a width and style, indexed by filled cell count.
     
+    Built on first use, after --no-color has had its say on C.
+    """
     # Gradient colors based on style
     if style == "cyan":
         # Cyan → Teal gradient
@@ -607,20 +1002,25 @@ def gradient_bar(pct: float, width: int = 20, style: str = "cyan") -> str:
     else:
         start = mid = end = C.CYAN
     
-    # Build gradient bar
-    if filled == 0:
-        bar = ""
-    elif filled <= width // 3:
-        bar = f"{start}{'█' * filled}"
-    elif filled <= 2 * width // 3:
-        third = width // 3
-        bar = f"{start}{'█' * third}{mid}{'█' * (filled - third)}"
-    else:
-        third = width // 3
-        bar = f"{start}{'█' * third}{mid}{'█' * third}{end}{'█' * (filled - 2*third)}"
-    
-    empty_bar = f"{C.GRAY}{'░' * empty}{C.RESET}"
-    return f"{bar}{C.RESET}{empty_bar}"
+    third = width // 3
+    bars = []
+    for filled in range(width + 1):
+        # Build gradient bar
+        if filled == 0:
+            bar = ""
+        elif filled <= third:
+            bar = f"{start}{'█' * filled}"
+        elif filled <= 2 * width // 3:
+            bar = f"{start}{'█' * third}{mid}{'█' * (filled - third)}"
+        else:
+            bar = f"{start}{'█' * third}{mid}{'█' * third}{end}{'█' * (filled - 2*third)}"
+        bars.append(f"{bar}{C.RESET}{C.GRAY}{'░' * (width - filled)}{C.RESET}")
+    return tuple(bars)
+
+
+def gradient_bar(pct: float, width: int = 20, style: str = "cyan") -> str:
+    """Create a gradient progress bar like btop disk usage."""
+    return _gradient_bars(width, style)[int(width * min(pct / 100, 1.0))]
 
 
 def print_file_type_breakdown(ext_stats: dict, category_stats: dict):
@@ -628,7 +1028,7 @@ def print_file_type_breakdown(ext_stats: dict, category_stats: dict):
     if not ext_stats:
         return
     
-    print_header("work breakdown by author")
+    lines = format_header("work breakdown by author")
     
     # Sort authors by total net lines, filter out zero contributors
     author_totals = {}
@@ -639,10 +1039,14 @@ def print_file_type_breakdown(ext_stats: dict, category_stats: dict):
             author_totals[author] = total_net
     
     if not author_totals:
-        print(f"\n{C.GRAY}No contributions in this date range.{C.RESET}")
+        lines.append(f"\n{C.GRAY}No contributions in this date range.{C.RESET}")
+        write_lines(lines)
         return
     
     sorted_authors = sorted(author_totals.items(), key=lambda x: x[1], reverse=True)
+    edge = f"{C.BOX}│{C.RESET}"
+    # Colors used on every bar row, bound once
+    RESET, GRAY, WHITE, TEAL, GREEN, RED = C.RESET, C.GRAY, C.WHITE, C.TEAL, C.GREEN, C.RED
     
     for author, total_net in sorted_authors:
         exts = ext_stats[author]
@@ -670,14 +1074,14 @@ def print_file_type_breakdown(ext_stats: dict, category_stats: dict):
         loc_str = f"{total_net:>+,} LoC"
         header_content = f" {author_display:<30} {C.GRAY}│{C.RESET} {C.CYAN}{primary_label:<10}{C.RESET} {C.GRAY}│{C.RESET} {C.BLUE}{loc_str:>16}{C.RESET} "
         
-        print(f"\n{C.BOX}┌{'─' * W}┐{C.RESET}")
-        print(f"{C.BOX}│{C.RESET}{C.MAGENTA}{C.BOLD}{author_display:<30}{C.RESET} {C.GRAY}│{C.RESET} {C.CYAN}{primary_label:<10}{C.RESET} {C.GRAY}│{C.RESET} {C.BLUE}{loc_str:>16}{C.RESET} {C.BOX}│{C.RESET}")
-        print(f"{C.BOX}├{'─' * W}┤{C.RESET}")
+        lines.append(f"\n{C.BOX}┌{'─' * W}┐{C.RESET}")
+        lines.append(f"{edge}{C.MAGENTA}{C.BOLD}{author_display:<30}{C.RESET} {C.GRAY}│{C.RESET} {C.CYAN}{primary_label:<10}{C.RESET} {C.GRAY}│{C.RESET} {C.BLUE}{loc_str:>16}{C.RESET} {edge}")
+        lines.append(f"{C.BOX}├{'─' * W}┤{C.RESET}")
         
         # File types section
         section_label = "file types"
         pad = W - len(section_label) - 1
-        print(f"{C.BOX}│{C.RESET}{C.CYAN}{section_label}{C.RESET}{' ' * pad}{C.BOX}│{C.RESET}")
+        lines.append(f"{edge}{C.CYAN}{section_label}{C.RESET}{' ' * pad}{edge}")
         
         for ext, data in sorted_exts[:6]:
             net = data["inserts"] - data["deletes"]
@@ -685,41 +1089,64 @@ def print_file_type_breakdown(ext_stats: dict, category_stats: dict):
                 continue
             pct = abs(net) / ext_total * 100 if ext_total > 0 else 0
             bar = gradient_bar(pct, width=20, style="cyan")
-            net_color = C.GREEN if net >= 0 else C.RED
+            net_color = GREEN if net >= 0 else RED
             # Build line: "  .ext     [bar] XX.X%  +XXX,XXX"
             line = f"  {ext:<6} {bar} {pct:>5.1f}%  {net_color}{net:>+10,}{C.RESET}"
             # Calculate visible length (without ANSI codes)
             visible_len = 2 + 6 + 1 + 20 + 1 + 6 + 2 + 10  # = 48
             pad = W - visible_len
-            print(f"{C.BOX}│{C.RESET}  {C.WHITE}{ext:<6}{C.RESET} {bar} {C.GRAY}{pct:>5.1f}%{C.RESET}  {net_color}{net:>+10,}{C.RESET}{' ' * pad}{C.BOX}│{C.RESET}")
+            lines.append(f"{edge}  {WHITE}{ext:<6}{RESET} {bar} {GRAY}{pct:>5.1f}%{RESET}  {net_color}{net:>+10,}{RESET}{' ' * pad}{edge}")
         
         # Blank line
-        print(f"{C.BOX}│{C.RESET}{' ' * W}{C.BOX}│{C.RESET}")
+        lines.append(f"{edge}{' ' * W}{edge}")
         
         # Work categories section
         section_label = "work type"
         pad = W - len(section_label) - 1
-        print(f"{C.BOX}│{C.RESET}{C.CYAN}{section_label}{C.RESET}{' ' * pad}{C.BOX}│{C.RESET}")
+        lines.append(f"{edge}{C.CYAN}{section_label}{C.RESET}{' ' * pad}{edge}")
         
         for cat, data in sorted_cats[:4]:
             net = data["inserts"] - data["deletes"]
             if net == 0:
                 continue
-            label, _ = CATEGORY_LABELS.get(cat, ("Other", C.GRAY))
+            label, _ = CATEGORY_LABELS.get(cat, ("Other", GRAY))
             pct = abs(net) / cat_total * 100 if cat_total > 0 else 0
             bar = gradient_bar(pct, width=20, style="green")
-            net_color = C.GREEN if net >= 0 else C.RED
+            net_color = GREEN if net >= 0 else RED
             visible_len = 2 + 8 + 1 + 20 + 1 + 6 + 2 + 10  # = 50
             pad = W - visible_len
-            print(f"{C.BOX}│{C.RESET}  {C.TEAL}{label:<8}{C.RESET} {bar} {C.GRAY}{pct:>5.1f}%{C.RESET}  {net_color}{net:>+10,}{C.RESET}{' ' * pad}{C.BOX}│{C.RESET}")
+            lines.append(f"{edge}  {TEAL}{label:<8}{RESET} {bar} {GRAY}{pct:>5.1f}%{RESET}  {net_color}{net:>+10,}{RESET}{' ' * pad}{edge}")
         
         # Focus line
-        print(f"{C.BOX}│{C.RESET}{' ' * W}{C.BOX}│{C.RESET}")
+        lines.append(f"{edge}{' ' * W}{edge}")
         work_desc = get_work_description(sorted_cats)
         focus_line = f"Focus: {work_desc}"[:W-1]
         pad = W - len(focus_line) - 1
-        print(f"{C.BOX}│{C.RESET}{C.GRAY}Focus:{C.RESET} {C.WHITE}{work_desc[:W-8]:<{W-8}}{C.RESET}{C.BOX}│{C.RESET}")
-        print(f"{C.BOX}└{'─' * W}┘{C.RESET}")
+        lines.append(f"{edge}{C.GRAY}Focus:{C.RESET} {C.WHITE}{work_desc[:W-8]:<{W-8}}{C.RESET}{edge}")
+        lines.append(f"{C.BOX}└{'─' * W}┘{C.RESET}")
+    
+    write_lines(lines)
+
+
+# Focus descriptions for the top one or two categories; pairs are keyed in
+# sorted order so either ranking of the two finds the same entry
+_WORK_DESCRIPTIONS = {
+    ("frontend",): "UI/UX development, component building",
+    ("backend",): "Server-side logic, API development",
+    ("fullstack",): "Full-stack JavaScript/TypeScript development",
+    ("database",): "Database schema, queries, migrations",
+    ("config",): "Configuration, project setup",
+    ("infra",): "Infrastructure, DevOps, deployment",
+    ("docs",): "Documentation, technical writing",
+    ("scripts",): "Automation, scripting, tooling",
+    ("testing",): "Test coverage, quality assurance",
+    ("frontend", "fullstack"): "Frontend-focused full-stack development",
+    ("backend", "fullstack"): "Backend-focused with JS/TS integration",
+    ("backend", "database"): "Backend + database architecture",
+    ("backend", "frontend"): "True full-stack development",
+    ("config", "infra"): "DevOps and infrastructure",
+    ("config", "docs"): "Documentation and project maintenance",
+}
 
 
 def get_work_description(sorted_cats: list) -> str:
@@ -728,88 +1155,100 @@ def get_work_description(sorted_cats: list) -> str:
         return "Mixed contributions"
     
     # Get top 2 categories
-    top_cats = [c[0] for c in sorted_cats[:2] if c[1]["inserts"] - c[1]["deletes"] > 0]
-    
-    descriptions = {
-        ("frontend",): "UI/UX development, component building",
-        ("backend",): "Server-side logic, API development",
-        ("fullstack",): "Full-stack JavaScript/TypeScript development",
-        ("database",): "Database schema, queries, migrations",
-        ("config",): "Configuration, project setup",
-        ("infra",): "Infrastructure, DevOps, deployment",
-        ("docs",): "Documentation, technical writing",
-        ("scripts",): "Automation, scripting, tooling",
-        ("testing",): "Test coverage, quality assurance",
-        ("frontend", "fullstack"): "Frontend-focused full-stack development",
-        ("backend", "fullstack"): "Backend-focused with JS/TS integration",
-        ("backend", "database"): "Backend + database architecture",
-        ("frontend", "backend"): "True full-stack development",
-        ("infra", "config"): "DevOps and infrastructure",
-        ("docs", "config"): "Documentation and project maintenance",
-    }
-    
-    key = tuple(top_cats[:2]) if len(top_cats) >= 2 else tuple(top_cats[:1])
-    return descriptions.get(key, descriptions.get(tuple(top_cats[:1]), "Mixed contributions"))
+    top_cats = tuple(c[0] for c in sorted_cats[:2] if c[1]["inserts"] - c[1]["deletes"] > 0)
+    if len(top_cats) < 2:
+        return _WORK_DESCRIPTIONS.get(top_cats, "Mixed contributions")
+    return (_WORK_DESCRIPTIONS.get(tuple(sorted(top_cats)))
+            or _WORK_DESCRIPTIONS.get(top_cats[:1], "Mixed contributions"))
 
 
 def print_banner(base_dir: Path, since: str, until: str, repo_count: int):
     """Print the omarchy-styled banner."""
-    w = get_term_width()
     now = datetime.now().strftime("%H:%M:%S")
+    GRAY, RESET = C.GRAY, C.RESET
+    rule = f"{C.BOX}{'═' * get_term_width()}{RESET}"
     
-    print(f"\n{C.BOX}{'═' * w}{C.RESET}")
-    print(f"{C.CYAN}{C.BOLD}  ┌repos┐ ┌review┐{C.RESET}                                      {C.GRAY}{now}{C.RESET}")
-    print(f"{C.BOX}{'═' * w}{C.RESET}")
-    print(f"  {C.GRAY}Path:{C.RESET}   {C.WHITE}{base_dir}{C.RESET}")
-    print(f"  {C.GRAY}Period:{C.RESET} {C.TEAL}{since}{C.RESET} {C.GRAY}→{C.RESET} {C.TEAL}{until or 'now'}{C.RESET}")
-    print(f"  {C.GRAY}Repos:{C.RESET}  {C.YELLOW}{repo_count}{C.RESET}")
-    print(f"{C.BOX}{'═' * w}{C.RESET}")
+    write_lines([
+        f"\n{rule}",
+        f"{C.CYAN}{C.BOLD}  ┌repos┐ ┌review┐{RESET}                                      {GRAY}{now}{RESET}",
+        rule,
+        f"  {GRAY}Path:{RESET}   {C.WHITE}{base_dir}{RESET}",
+        f"  {GRAY}Period:{RESET} {C.TEAL}{since}{RESET} {GRAY}→{RESET} {C.TEAL}{until or 'now'}{RESET}",
+        f"  {GRAY}Repos:{RESET}  {C.YELLOW}{repo_count}{RESET}",
+        rule,
+    ])
 
 
 def write_csv(data: list[dict], output_path: str):
     if not data:
         return
     data = sorted(data, key=lambda x: (x["author"].lower(), x["repo"].lower()))
-    with open(output_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=["author", "repo", "commits", "inserts", "deletes", "net"])
-        writer.writeheader()
-        writer.writerows(data)
+    fieldnames = ["author", "repo", "commits", "inserts", "deletes", "net"]
+    # Rows go to the C writer as tuples, skipping DictWriter's per-row key
+    # checks; the large buffer lets the whole file go out in few writes
+    with open(output_path, "w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(map(itemgetter(*fieldnames), data))
     print(f"\n{C.GRAY}CSV written to:{C.RESET} {C.CYAN}{output_path}{C.RESET}")
 
 
 def create_dot_plot(weekly_stats: dict, output_path: str, since: str):
     try:
+        import matplotlib
+        # Only savefig is used; never start a GUI backend
+        matplotlib.use("Agg")
         import matplotlib.pyplot as plt
         import matplotlib.dates as mdates
+        import numpy as np  # installed with matplotlib
+        from matplotlib.colors import to_rgba_array
         from matplotlib.lines import Line2D
     except ImportError:
         print(f"\n{C.YELLOW}Note: pip install matplotlib for chart generation{C.RESET}")
         return
 
-    authors = sorted(weekly_stats.keys(), key=lambda a: sum(
-        d["inserts"] - d["deletes"] for d in weekly_stats[a].values()
-    ), reverse=True)
-
-    top_authors = authors[:12]
+    # Net lines per author, computed once; only the top 12 are ranked
+    # (nlargest keeps sorted()'s order, ties included)
+    net_totals = {
+        author: sum(d["inserts"] for d in weeks.values()) - sum(d["deletes"] for d in weeks.values())
+        for author, weeks in weekly_stats.items()
+    }
+    top_authors = heapq.nlargest(12, net_totals, key=net_totals.__getitem__)
     author_colors = {author: AUTHOR_COLORS[i % len(AUTHOR_COLORS)] for i, author in enumerate(top_authors)}
 
     fig, ax = plt.subplots(figsize=(16, 10))
     fig.patch.set_facecolor('#0B0C16')  # main_bg from hackerman theme
     ax.set_facecolor('#0B0C16')
 
+    # All points go into one scatter collection; each plotted author gets
+    # the next y row, in ranking order. Per-author weeks become arrays once,
+    # so filtering and sizing run in NumPy
+    dates, rows, sizes = [], [], []
+    plotted = []
     for author in top_authors:
-        weeks = sorted(weekly_stats[author].keys())
-        if not weeks:
+        weeks = weekly_stats[author]
+        week_dates = np.array(list(weeks), dtype="datetime64[D]")
+        net = np.fromiter((d["inserts"] - d["deletes"] for d in weeks.values()), dtype=np.int64, count=len(weeks))
+        order = np.argsort(week_dates)
+        week_dates, net = week_dates[order], net[order]
+        mask = net > 0
+        count = int(mask.sum())
+        if not count:
             continue
-        dates, sizes = [], []
-        for week in weeks:
-            data = weekly_stats[author][week]
-            net = data["inserts"] - data["deletes"]
-            if net > 0:
-                dates.append(week)
-                sizes.append(max(10, min(500, (net ** 0.5) * 3)))
-        if dates:
-            ax.scatter(dates, [author] * len(dates), s=sizes, c=author_colors[author], alpha=0.8, edgecolors='#4fe88f', linewidths=0.5)
+        dates.append(week_dates[mask])
+        rows.append(np.full(count, len(plotted)))
+        sizes.append(np.clip(np.sqrt(net[mask]) * 3, 10, 500))
+        plotted.append(author)
+    months_span = 0
+    if dates:
+        dates = np.concatenate(dates)
+        rows = np.concatenate(rows)
+        months_span = int((dates.max() - dates.min()).astype(int)) // 30
+        # Resolve each author's color once; points pick theirs by row index
+        palette = to_rgba_array([author_colors[author] for author in plotted])
+        ax.scatter(dates, rows, s=np.concatenate(sizes), c=palette[rows],
+                   alpha=0.8, edgecolors='#4fe88f', linewidths=0.5, rasterized=True)
+    ax.set_yticks(range(len(plotted)), plotted)
 
     # Hackerman theme colors
     hi_fg = '#7cf8f7'      # Bright cyan
@@ -821,7 +1260,9 @@ def create_dot_plot(weekly_stats: dict, output_path: str, since: str):
     ax.set_xlabel('Week', fontsize=12, color=hi_fg, labelpad=10)
     ax.set_title(f'Weekly Code Contributions\n{since} → now', fontsize=16, color=title_color, pad=20, fontweight='bold')
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
-    ax.xaxis.set_major_locator(mdates.MonthLocator(interval=1))
+    # Monthly ticks up to two years, then every N months so long histories
+    # keep roughly a dozen rotated labels to lay out
+    ax.xaxis.set_major_locator(mdates.MonthLocator(interval=max(1, months_span // 12)))
     plt.xticks(rotation=45, ha='right', color=hi_fg)
     plt.yticks(color=main_fg)
     ax.grid(True, axis='x', alpha=0.2, color=inactive, linestyle='--')
@@ -835,7 +1276,9 @@ def create_dot_plot(weekly_stats: dict, output_path: str, since: str):
     for text in legend.get_texts():
         text.set_color(main_fg)
 
-    plt.tight_layout()
+    # Fixed margins instead of tight_layout's solver; bbox_inches='tight'
+    # still crops the saved image to the title, labels and legend
+    fig.subplots_adjust(left=0.08, right=0.82, top=0.93, bottom=0.12)
     plt.savefig(output_path, dpi=150, facecolor=fig.get_facecolor(), edgecolor='none', bbox_inches='tight')
     plt.close()
     print(f"\n{C.GRAY}Chart saved to:{C.RESET} {C.CYAN}{output_path}{C.RESET}")
@@ -846,6 +1289,7 @@ def create_dot_plot(weekly_stats: dict, output_path: str, since: str):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def main():
+    global C
     parser = argparse.ArgumentParser(description="Omarchy Repo Contribution Analyzer")
     parser.add_argument("--since", default=DEFAULT_SINCE, help=f"Start date (default: {DEFAULT_SINCE})")
     parser.add_argument("--until", default=None, help="End date (default: today)")
@@ -856,6 +1300,12 @@ def main():
     parser.add_argument("--repo", default=None, help="Analyze a single repo from GitHub URL (https or ssh)")
     parser.add_argument("--no-docs", action="store_true", help="Exclude documentation files (.md, .txt, etc)")
     parser.add_argument("--no-color", action="store_true", help="Disable colored output")
+    parser.add_argument("--no-breakdown", action="store_true",
+                        help="Skip the per-author work breakdown (faster: reads per-commit totals only)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached git log results and re-read every repo")
+    parser.add_argument("--include-branches", action="store_true",
+                        help="Also count local branches (default: HEAD and origin's branches; tags, stashes "
+                             "and other refs are never counted)")
 
     args = parser.parse_args()
     
@@ -866,9 +1316,7 @@ def main():
 
     # Disable colors if requested or not a tty
     if args.no_color or not sys.stdout.isatty():
-        for attr in dir(C):
-            if not attr.startswith('_'):
-                setattr(C, attr, '')
+        C = _NO_COLOR
 
     # Set global docs exclusion flag
     global EXCLUDE_DOCS
@@ -879,7 +1327,9 @@ def main():
     
     # Choose repo discovery method
     if args.repo:
-        # Single repo mode - clone to temp directory
+        # Single repo mode - clone to temp directory (tempfile, with its
+        # random/weakref imports, is only needed here)
+        import tempfile
         temp_dir = Path(tempfile.mkdtemp(prefix="repo_review_"))
         try:
             repo_info = clone_single_repo(args.repo, temp_dir)
@@ -905,11 +1355,18 @@ def main():
     print_banner(Path(source) if args.repo else base_dir, args.since, args.until, len(repos))
 
     print(f"\n{C.CYAN}Scanning repositories...{C.RESET}")
-    data, weekly_stats, ext_stats, category_stats = analyze_repos(repos, args.since, args.until)
+    # Per-file numstat rows are only needed for the breakdown; the chart
+    # and the summary tables work from per-commit totals
+    per_file = not args.no_breakdown
+    data, weekly_stats, ext_stats, category_stats = analyze_repos(
+        repos, args.since, args.until, per_file, use_cache=not args.no_cache,
+        refs=BRANCH_REFS if args.include_branches else LOG_REFS
+    )
 
     print_repo_table(data)
     print_author_summary(data)
-    print_file_type_breakdown(ext_stats, category_stats)
+    if per_file:
+        print_file_type_breakdown(ext_stats, category_stats)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     if args.output:
@@ -7,6 +7,9 @@ from pathlib import Path
 
 BASE_DIR = Path(__file__).parent.parent / "output"
 
+# Fragments fetched in parallel for segmented (HLS/DASH) streams
+CONCURRENT_FRAGMENTS = 4
+
 
 def download(url: str, audio_only: bool = False, quality: int = None, audio_format: str = "mp3"):
     """Download video or extract audio."""
@@ -17,6 +20,7 @@ def download(url: str, audio_only: bool = False, quality: int = None, audio_form
             "yt-dlp", "-x",
             "--audio-format", audio_format,
             "--audio-quality", "0",
+            "-N", str(CONCURRENT_FRAGMENTS),
             "-o", str(out_dir / "%(title)s.%(ext)s"),
             url
         ]
@@ -27,11 +31,13 @@ def download(url: str, audio_only: bool = False, quality: int = None, audio_form
         cmd = [
             "yt-dlp", "-f", fmt,
             "--merge-output-format", "mp4",
+            "-N", str(CONCURRENT_FRAGMENTS),
             "-o", str(out_dir / "%(title)s.%(ext)s"),
             url
         ]
     
-    print(f"Downloading to: {out_dir}")
+    # Flush first so the line lands before yt-dlp's output when piped
+    print(f"Downloading to: {out_dir}", flush=True)
     subprocess.run(cmd, check=True)
     print("Done!")
 
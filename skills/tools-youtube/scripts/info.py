@@ -4,8 +4,18 @@
 import argparse
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# yt-dlp metadata runs to hundreds of KB per video; orjson parses it
+# several times faster when installed
+loads = orjson.loads if orjson is not None else json.loads
+
 OUTPUT_DIR = Path(__file__).parent.parent / "output" / "info"
 
 
@@ -13,50 +23,84 @@ def get_info(url: str, dump_json: bool = False, show_formats: bool = False) -> d
     """Fetch video metadata."""
     cmd = ["yt-dlp", "--dump-json", "--no-download", url]
     result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    info = json.loads(result.stdout)
+    info = loads(result.stdout)
     
     if dump_json:
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         out = OUTPUT_DIR / f"{info['id']}.json"
-        out.write_text(json.dumps(info, indent=2))
+        # orjson writes the indented UTF-8 bytes directly, with no interim str
+        if orjson is not None:
+            out.write_bytes(orjson.dumps(info, option=orjson.OPT_INDENT_2))
+        else:
+            out.write_text(json.dumps(info, indent=2))
         print(f"Saved: {out}")
     
     return info
 
 
+def try_get_info(url: str, dump_json: bool = False):
+    """Fetch video metadata, returning the CalledProcessError instead of raising it."""
+    try:
+        return get_info(url, dump_json)
+    except subprocess.CalledProcessError as e:
+        return e
+
+
+def get_infos_parallel(urls: list[str], dump_json: bool = False, max_workers: int = 8) -> list:
+    """Fetch metadata for many videos concurrently, in input order.
+    
+    Each yt-dlp call is network-bound, so threads overlap them. Failed
+    fetches come back as their CalledProcessError (see try_get_info).
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(try_get_info, urls, [dump_json] * len(urls)))
+
+
 def format_duration(seconds: int) -> str:
     """Format seconds as HH:MM:SS."""
     h, m, s = seconds // 3600, (seconds % 3600) // 60, seconds % 60
     return f"{h}:{m:02d}:{s:02d}" if h else f"{m}:{s:02d}"
 
 
+def print_info(info: dict, show_formats: bool = False):
+    """Print a video's metadata summary."""
+    print(f"\nTitle:    {info.get('title')}")
+    print(f"Channel:  {info.get('channel')}")
+    print(f"Duration: {format_duration(info.get('duration', 0))}")
+    print(f"Views:    {info.get('view_count', 0):,}")
+    print(f"Date:     {info.get('upload_date', 'N/A')}")
+    print(f"ID:       {info.get('id')}")
+    
+    if show_formats:
+        print("\nFormats:")
+        for f in info.get("formats", [])[-10:]:
+            res = f.get("resolution", "audio")
+            ext = f.get("ext")
+            note = f.get("format_note", "")
+            print(f"  {f['format_id']:>6} | {res:>10} | {ext:>4} | {note}")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Get YouTube video info")
-    parser.add_argument("url", help="YouTube URL")
+    parser.add_argument("url", nargs="+", help="YouTube URL(s)")
     parser.add_argument("--json", "-j", action="store_true", help="Save full JSON")
     parser.add_argument("--formats", "-f", action="store_true", help="Show available formats")
+    parser.add_argument("--parallel", "-p", action="store_true", help="Fetch multiple URLs concurrently")
     args = parser.parse_args()
     
-    try:
-        info = get_info(args.url, args.json, args.formats)
-        
-        print(f"\nTitle:    {info.get('title')}")
-        print(f"Channel:  {info.get('channel')}")
-        print(f"Duration: {format_duration(info.get('duration', 0))}")
-        print(f"Views:    {info.get('view_count', 0):,}")
-        print(f"Date:     {info.get('upload_date', 'N/A')}")
-        print(f"ID:       {info.get('id')}")
-        
-        if args.formats:
-            print("\nFormats:")
-            for f in info.get("formats", [])[-10:]:
-                res = f.get("resolution", "audio")
-                ext = f.get("ext")
-                note = f.get("format_note", "")
-                print(f"  {f['format_id']:>6} | {res:>10} | {ext:>4} | {note}")
-                
-    except subprocess.CalledProcessError as e:
-        print(f"Error: {e.stderr}")
+    if args.parallel:
+        infos = get_infos_parallel(args.url, args.json)
+    else:
+        infos = (try_get_info(url, args.json) for url in args.url)
+    
+    failed = False
+    for info in infos:
+        if isinstance(info, subprocess.CalledProcessError):
+            print(f"Error: {info.stderr}")
+            failed = True
+        else:
+            print_info(info, args.formats)
+    if failed:
         exit(1)
 
 
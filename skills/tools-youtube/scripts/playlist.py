@@ -6,18 +6,31 @@ import json
 import subprocess
 from pathlib import Path
 
+from info import get_infos_parallel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# yt-dlp metadata runs to hundreds of KB per video; orjson parses it
+# several times faster when installed
+loads = orjson.loads if orjson is not None else json.loads
+
 BASE_DIR = Path(__file__).parent.parent / "output"
 
+# Fragments fetched in parallel for segmented (HLS/DASH) streams
+CONCURRENT_FRAGMENTS = 4
+
 
 def list_videos(url: str) -> list:
     """Get all videos in playlist."""
     cmd = ["yt-dlp", "--flat-playlist", "--dump-json", url]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    
-    videos = []
-    for line in result.stdout.strip().split("\n"):
-        if line:
-            videos.append(json.loads(line))
+    # Parse each entry as yt-dlp prints it rather than after it exits
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=1 << 16) as proc:
+        videos = [loads(line) for line in proc.stdout if line.strip()]
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
     return videos
 
 
@@ -30,6 +43,7 @@ def download_playlist(url: str, audio_only: bool = False, quality: int = None,
         cmd = [
             "yt-dlp", "-x",
             "--audio-format", audio_format,
+            "-N", str(CONCURRENT_FRAGMENTS),
             "-o", str(out_dir / "%(playlist_index)s - %(title)s.%(ext)s"),
         ]
     else:
@@ -39,6 +53,7 @@ def download_playlist(url: str, audio_only: bool = False, quality: int = None,
         cmd = [
             "yt-dlp", "-f", fmt,
             "--merge-output-format", "mp4",
+            "-N", str(CONCURRENT_FRAGMENTS),
             "-o", str(out_dir / "%(playlist_index)s - %(title)s.%(ext)s"),
         ]
     
@@ -46,7 +61,8 @@ def download_playlist(url: str, audio_only: bool = False, quality: int = None,
         cmd.extend(["--playlist-items", video_range])
     
     cmd.append(url)
-    print(f"Downloading to: {out_dir}")
+    # Flush first so the line lands before yt-dlp's output when piped
+    print(f"Downloading to: {out_dir}", flush=True)
     subprocess.run(cmd, check=True)
 
 
@@ -58,6 +74,8 @@ def main():
     parser.add_argument("--quality", "-q", type=int, help="Max video height")
     parser.add_argument("--range", "-r", help="Video range (e.g., 1-5, 1,3,5)")
     parser.add_argument("--format", "-f", default="mp3", help="Audio format")
+    parser.add_argument("--parallel", "-p", action="store_true",
+                        help="Fetch full metadata for every video concurrently (fills in missing durations)")
     args = parser.parse_args()
     
     try:
@@ -65,6 +83,10 @@ def main():
             download_playlist(args.url, args.audio, args.quality, args.range, args.format)
         else:
             videos = list_videos(args.url)
+            if args.parallel:
+                # Flat entries carry a URL (or at least an ID) yt-dlp can resolve
+                infos = get_infos_parallel([v.get("url") or v["id"] for v in videos])
+                videos = [info if isinstance(info, dict) else v for v, info in zip(videos, infos)]
             print(f"\nPlaylist: {len(videos)} videos\n")
             for i, v in enumerate(videos, 1):
                 title = v.get("title", "N/A")[:60]
@@ -8,6 +8,11 @@ from pathlib import Path
 
 OUTPUT_DIR = Path(__file__).parent.parent / "output" / "transcripts"
 
+# VTT cue numbers/timings, inline tags, and header lines, matched per line
+_TS_RE = re.compile(rb"^\d+$|^\d{2}:\d{2}")
+_TAG_RE = re.compile(rb"<[^>]+>|\{[^}]+\}")
+_SKIP_PREFIX = (b"WEBVTT", b"Kind:", b"Language:")
+
 
 def video_id(url: str) -> str:
     """Extract video ID from URL."""
@@ -15,20 +20,21 @@ def video_id(url: str) -> str:
     return match.group(1) if match else url[:11]
 
 
-def clean_vtt(content: str) -> str:
-    """Parse VTT and return clean text."""
-    lines, seen = [], set()
-    for line in content.split("\n"):
+def clean_vtt(content: bytes) -> str:
+    """Parse raw VTT bytes and return clean text, decoded once at the end."""
+    # Insertion-ordered dict: keeps the first occurrence of each line
+    lines = {}
+    for line in content.splitlines():
         line = line.strip()
-        if not line or "-->" in line or line.startswith(("WEBVTT", "Kind:", "Language:")):
+        # bytes.find is much cheaper than `in` for a bytes needle
+        if not line or line.find(b"-->") != -1 or line.startswith(_SKIP_PREFIX):
             continue
-        if re.match(r"^\d+$|^\d{2}:\d{2}", line):
+        if _TS_RE.match(line):
             continue
-        line = re.sub(r"<[^>]+>|\{[^}]+\}", "", line)
-        if line and line not in seen:
-            seen.add(line)
-            lines.append(line)
-    return "\n".join(lines)
+        line = _TAG_RE.sub(b"", line)
+        if line:
+            lines[line] = None
+    return b"\n".join(lines).decode("utf-8", "replace")
 
 
 def extract(url: str, lang: str = "en", timestamps: bool = False) -> str:
@@ -46,7 +52,7 @@ def extract(url: str, lang: str = "en", timestamps: bool = False) -> str:
     
     # Find and parse subtitle file
     for f in OUTPUT_DIR.glob(f"{vid}*.vtt"):
-        transcript = clean_vtt(f.read_text())
+        transcript = clean_vtt(f.read_bytes())
         f.unlink()  # Clean up
         
         # Save transcript